@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Convert an email classification dataset (JSON array) to MLX JSONL training data.
+
+Streams the input with ijson when available so the whole dataset never has to
+sit in memory; falls back to json.load otherwise. Conversion, category counting
+and the sample printout all happen in a single pass over the input.
+"""
+
+import json
+import sys
+from collections import Counter
+
+try:
+    import ijson  # optional - enables streaming parse of the input array
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional - fast serializer that emits UTF-8 bytes directly
+except ImportError:
+    orjson = None
+
+
+# Fixed pieces of the prompt template - hoisted so the per-row hot path
+# is two concatenations instead of re-rendering an f-string template
+_PREFIX = "Classify this email:\n\n"
+_SUFFIX = "\n\nCategory: "
+
+
+def convert_to_training_format(entry):
+    """Build the {"text": ...} training record for one email."""
+    return {"text": _PREFIX + entry['Content'] + _SUFFIX + entry['Classification']}
+
+
+def iter_entries(input_file):
+    """Yield dataset entries one at a time without materializing the list."""
+    if ijson is not None:
+        with open(input_file, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        # Fallback: load everything (only used when ijson isn't installed)
+        with open(input_file, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def _dump_line(obj):
+    """Serialize one JSONL record to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def convert_to_jsonl(input_file, output_file):
+    """Convert input JSON to JSONL, tracking category counts as we go."""
+    category_counts = Counter()
+    written = 0
+    first_entry = None
+
+    # Batch serialized lines so the file object sees large writes instead
+    # of one tiny write per entry
+    with open(output_file, 'wb', buffering=1 << 20) as out:
+        buf = []
+        for entry in iter_entries(input_file):
+            jsonl_entry = convert_to_training_format(entry)
+            buf.append(_dump_line(jsonl_entry))
+            if len(buf) >= 1024:
+                out.write(b''.join(buf))
+                buf.clear()
+            category_counts[entry['Classification']] += 1
+            if first_entry is None:
+                first_entry = jsonl_entry
+            written += 1
+        if buf:
+            out.write(b''.join(buf))
+
+    print(f"Converted {written} entries to {output_file}")
+
+    # Emit the distribution as one write instead of a print per category
+    lines = ["\nCategory distribution:"]
+    lines.extend(
+        f"  {category}: {count} ({count / written * 100 if written else 0.0:.1f}%)"
+        for category, count in sorted(category_counts.items())
+    )
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+    # Show a sample entry from the one we kept during the write loop -
+    # no need to re-open and re-parse the output file
+    if first_entry is not None:
+        print("\nSample entry:")
+        print(json.dumps(first_entry, indent=2, ensure_ascii=False))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: convert-to-jsonl.py <input.json> [output.jsonl]")
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    output_file = sys.argv[2] if len(sys.argv) > 2 else "train.jsonl"
+    convert_to_jsonl(input_file, output_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Drive an MLX LoRA fine-tuning run from a small JSON config.
+
+Invokes mlx_lm's LoRA entry point in-process by default, which skips the
+full interpreter + MLX cold start a `python -m mlx_lm lora` launch pays
+on every run; pass --subprocess to get the isolated launch back.
+"""
+
+import argparse
+import functools
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+DEFAULT_CONFIG = "tuner-config.json"
+
+
+@functools.lru_cache(maxsize=None)
+def load_config(config_path=DEFAULT_CONFIG):
+    """Load the tuner configuration (memoized per path)."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config.setdefault("model", "./model/llama")
+    config.setdefault("data", "./data")
+    config.setdefault("iters", 1000)
+    return config
+
+
+def build_lora_args(config):
+    """Map the tuner config onto mlx_lm.lora CLI arguments."""
+    args = [
+        "--model", str(config["model"]),
+        "--train",
+        "--data", str(config["data"]),
+        "--iters", str(config["iters"]),
+    ]
+    if "adapter_path" in config:
+        args += ["--adapter-path", str(config["adapter_path"])]
+    if "batch_size" in config:
+        args += ["--batch-size", str(config["batch_size"])]
+    if "learning_rate" in config:
+        args += ["--learning-rate", str(config["learning_rate"])]
+    return args
+
+
+def _prefetch_model(model_path):
+    """
+    Warm the page cache for the model's safetensors shards.
+
+    Training spends its first seconds reading multi-GB shard files; reading
+    them in 16 MB blocks ahead of time means the kernel already has the
+    pages resident when mlx_lm mmaps them.
+    """
+    try:
+        for shard in Path(model_path).glob('*.safetensors'):
+            with open(shard, 'rb', buffering=0) as f:
+                while f.read(16 * 1024 * 1024):
+                    pass
+    except OSError:
+        pass
+
+
+def run_mlx_lora(config, use_subprocess=False):
+    """Run the LoRA training pass."""
+    lora_args = build_lora_args(config)
+
+    # Overlap shard reads with argument parsing / import time. Skipped
+    # when the model is a HF ID that hasn't been downloaded locally.
+    model_path = Path(config["model"])
+    if model_path.is_dir():
+        threading.Thread(
+            target=_prefetch_model, args=(model_path,), daemon=True
+        ).start()
+
+    if use_subprocess:
+        cmd = [sys.executable, "-m", "mlx_lm", "lora"] + lora_args
+        # Line-buffered pipe + explicit tee keeps progress lines streaming
+        # in real time even when our own stdout is redirected, instead of
+        # stalling behind the 64 KB pipe buffer
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+        )
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+        rc = proc.wait()
+        if rc != 0:
+            raise subprocess.CalledProcessError(rc, cmd)
+        return
+
+    # In-process launch: reuses this interpreter's mlx/mlx_lm imports and
+    # tokenizer cache instead of re-importing everything in a child python.
+    # mlx_lm.lora's main() reads sys.argv, so drive it through the same
+    # argument list the CLI would see.
+    from mlx_lm import lora as mlx_lora
+
+    argv = sys.argv
+    sys.argv = ["mlx_lm.lora"] + lora_args
+    try:
+        mlx_lora.main()
+    finally:
+        sys.argv = argv
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run LoRA fine-tuning from a JSON config"
+    )
+    parser.add_argument(
+        "config", nargs="?", default=DEFAULT_CONFIG,
+        help="Path to tuner config JSON"
+    )
+    parser.add_argument(
+        "--subprocess", action="store_true",
+        help="Launch training in a separate interpreter (old behavior)"
+    )
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    run_mlx_lora(config, use_subprocess=args.subprocess)
+
+
+if __name__ == "__main__":
+    main()
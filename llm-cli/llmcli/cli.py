@@ -25,6 +25,9 @@ EXIT_IO_ERROR = 6
 
 MAX_TOOL_ITERATIONS = 10
 
+# Refuse prompt files larger than this to avoid pathological memory use
+MAX_PROMPT_FILE_BYTES = 10 * 1024 * 1024  # 10 MB
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -116,8 +119,25 @@ def read_prompt(args: argparse.Namespace) -> str:
         return args.prompt
     elif args.prompt_file:
         try:
+            # Check size up front - the reported length can't be trusted to
+            # stay small, and reading in chunks keeps peak allocations low
+            size = Path(args.prompt_file).stat().st_size
+            if size > MAX_PROMPT_FILE_BYTES:
+                print(
+                    f"Error: Prompt file too large ({size} bytes, "
+                    f"max {MAX_PROMPT_FILE_BYTES})",
+                    file=sys.stderr
+                )
+                sys.exit(EXIT_IO_ERROR)
+
+            chunks = []
             with open(args.prompt_file, 'r', encoding='utf-8') as f:
-                return f.read()
+                while True:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            return "".join(chunks)
         except Exception as e:
             print(f"Error: Failed to read prompt file: {e}", file=sys.stderr)
             sys.exit(EXIT_IO_ERROR)
@@ -215,8 +235,8 @@ async def run_prompt(
                 continue
         
         # No tool calls detected, write final response and exit
-        for char in response_text:
-            output_writer.write_token(char)
+        # The response is already complete, so one write beats a per-char loop
+        output_writer.write_text(response_text)
         break
     
     # Check if we hit max iterations
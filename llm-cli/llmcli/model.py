@@ -45,11 +45,33 @@ class MLXModel:
                 self.model, self.tokenizer = result
             else:
                 self.model, self.tokenizer, _ = result
-                
+
         except Exception as e:
             raise ModelError(
                 f"Failed to load model '{self.model_path}': {e}"
             )
+
+        self._warmup()
+
+    def _warmup(self):
+        """
+        Run a tiny generation to trigger lazy imports and kernel compilation
+
+        The first mlx_lm.generate call pays one-off JIT and import costs;
+        doing it here moves that latency from the first prompt to startup.
+        Warmup is best-effort - failures surface on real use.
+        """
+        try:
+            mlx_lm.generate(  # type: ignore
+                self.model,
+                self.tokenizer,
+                prompt="hi",
+                max_tokens=1,
+                sampler=make_sampler(temp=0.0),
+                verbose=False
+            )
+        except Exception:
+            pass
     
     def generate(
         self, 
@@ -45,7 +45,23 @@ class OutputWriter:
         
         self.file_handle.write(token)
         self.file_handle.flush()
-    
+
+    def write_text(self, text: str):
+        """
+        Write a complete text block in a single call
+
+        Unlike write_token, this issues one write and one flush for the
+        whole block, avoiding per-character I/O overhead.
+
+        Args:
+            text: Text to write
+        """
+        if not self._opened or not self.file_handle:
+            raise RuntimeError("OutputWriter not opened")
+
+        self.file_handle.write(text)
+        self.file_handle.flush()
+
     def finalize(self):
         """Flush and close output"""
         if self.file_handle and self._opened:
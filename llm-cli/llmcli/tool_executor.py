@@ -119,7 +119,9 @@ class ToolExecutor:
             description = tool_info.get("description", "No description")
             input_schema = tool_info.get("inputSchema", {})
             
-            tool_desc = f"\n- {tool_name}: {description}"
+            # Accumulate pieces in a list and join once - repeated += on a
+            # string copies the whole prefix on every concatenation
+            parts = [f"\n- {tool_name}: {description}"]
             
             if "properties" in input_schema:
                 params = input_schema["properties"]
@@ -154,13 +156,13 @@ class ToolExecutor:
                         example_args[param_name] = "value"
                 
                 if param_list:
-                    tool_desc += "\n  Parameters:\n" + "\n".join(param_list)
-                    
+                    parts.append("\n  Parameters:\n" + "\n".join(param_list))
+
                 if example_args:
                     example_json = json.dumps({"name": tool_name, "arguments": example_args}, indent=2)
-                    tool_desc += f"\n  Example:\n  <tool_call>\n  {example_json}\n  </tool_call>"
-            
-            tool_descriptions.append(tool_desc)
+                    parts.append(f"\n  Example:\n  <tool_call>\n  {example_json}\n  </tool_call>")
+
+            tool_descriptions.append("".join(parts))
         
         tool_descriptions.append("\n\nTo use a tool, generate a tool call in the exact format shown in the examples above.")
         
@@ -25,11 +25,13 @@ setup(
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
     ],
     python_requires=">=3.10",
     install_requires=[
         "mlx-lm>=0.18.0",
         "rich>=13.0.0",
+        "mcp-host>=0.1.0",
     ],
     entry_points={
         "console_scripts": [
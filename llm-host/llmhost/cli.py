@@ -3,9 +3,12 @@ Command-line interface and main application loop
 """
 
 import sys
+import json
 import signal
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import Optional
 
 from llmhost.config import load_config, load_mcp_config, ConfigError
@@ -37,6 +40,18 @@ class LLMHost:
         self.tool_executor: Optional[ToolExecutor] = None
         self.conversation: Optional[ConversationHistory] = None
         self.running = True
+
+        # LRU cache of completed responses keyed on conversation state.
+        # Only responses without tool calls are cached (tool output is
+        # non-deterministic), so repeated identical prompts cost no compute.
+        self._response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._response_cache_size = 0
+
+        # On free-threaded builds (PEP 703) note which mode we run in -
+        # Python-side work between MLX calls scales with threads there
+        if hasattr(sys, "_is_gil_enabled"):
+            gil_mode = "enabled" if sys._is_gil_enabled() else "disabled (free-threaded)"
+            logging.getLogger(__name__).info("Running with GIL %s", gil_mode)
     
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
@@ -52,6 +67,7 @@ class LLMHost:
             # Load configurations
             self.console.print_info("Loading configurations...")
             config = load_config("config.json")
+            self._response_cache_size = int(config.get("ResponseCacheSize", 128))
             # We just validate mcp.json exists, mcp-host will load it
             _ = load_mcp_config("mcp.json")
             
@@ -103,10 +119,16 @@ class LLMHost:
             
         # Add user message to history
         self.conversation.add_user_message(user_input)
-        
+
         # Generate response
         await self._generate_response()
-    
+
+    @staticmethod
+    def _cache_key(messages) -> bytes:
+        """Build a stable cache key from the full conversation state"""
+        payload = json.dumps(messages, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
     async def _generate_response(self):
         """Generate response with potential tool calls"""
         if not self.model or not self.conversation or not self.tool_executor:
@@ -120,7 +142,18 @@ class LLMHost:
             
             # Get messages for model
             messages = self.conversation.get_messages()
-            
+
+            # Serve repeated conversation states straight from the cache
+            cache_key = None
+            if self._response_cache_size > 0:
+                cache_key = self._cache_key(messages)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    self.console.print_assistant_response(cached)
+                    self.conversation.add_assistant_message(cached)
+                    break
+
             # Generate response with streaming
             self.console.print_assistant_prefix()
             
@@ -143,6 +176,11 @@ class LLMHost:
             
             if not tool_calls:
                 # No tool calls, add response and finish
+                # Tool-free responses are deterministic enough to cache
+                if cache_key is not None:
+                    self._response_cache[cache_key] = response_text
+                    if len(self._response_cache) > self._response_cache_size:
+                        self._response_cache.popitem(last=False)
                 self.conversation.add_assistant_message(response_text)
                 break
             
@@ -133,7 +133,9 @@ class ToolExecutor:
             input_schema = tool_info.get("inputSchema", {})
             
             # Format tool signature
-            tool_desc = f"\n- {tool_name}: {description}"
+            # Accumulate pieces in a list and join once - repeated += on a
+            # string copies the whole prefix on every concatenation
+            parts = [f"\n- {tool_name}: {description}"]
             
             # Add parameters if available
             if "properties" in input_schema:
@@ -177,14 +179,14 @@ class ToolExecutor:
                         example_args[param_name] = "value"
                 
                 if param_list:
-                    tool_desc += "\n  Parameters:\n" + "\n".join(param_list)
-                    
+                    parts.append("\n  Parameters:\n" + "\n".join(param_list))
+
                 # Add example usage with proper formatting
                 if example_args:
                     example_json = json.dumps({"name": tool_name, "arguments": example_args}, indent=2)
-                    tool_desc += f"\n  Example:\n  <tool_call>\n  {example_json}\n  </tool_call>"
-            
-            tool_descriptions.append(tool_desc)
+                    parts.append(f"\n  Example:\n  <tool_call>\n  {example_json}\n  </tool_call>")
+
+            tool_descriptions.append("".join(parts))
         
         return "\n".join(tool_descriptions)
     
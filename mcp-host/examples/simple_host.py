@@ -24,18 +24,19 @@ async def main():
     async with MCPHost(config_path="mcp.json") as host:
         logger.info("MCP Host initialized successfully")
         
-        # Get all tools from all servers
-        tools = await host.get_tools()
+        # Fetch all capabilities concurrently - each call round-trips to
+        # the servers, so gather makes this cost max() instead of sum()
+        tools, prompts, resources = await asyncio.gather(
+            host.get_tools(),
+            host.get_prompts(),
+            host.get_resources()
+        )
         logger.info(f"Available tools: {len(tools)}")
         for tool in tools:
             print(f"  - {tool['server']}.{tool['name']}: {tool.get('description', 'No description')}")
-        
-        # Get prompts
-        prompts = await host.get_prompts()
+
         logger.info(f"Available prompts: {len(prompts)}")
-        
-        # Get resources
-        resources = await host.get_resources()
+
         logger.info(f"Available resources: {len(resources)}")
         
         # Get metrics
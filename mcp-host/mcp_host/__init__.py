@@ -13,7 +13,8 @@ from .exceptions import (
     ServerStartupError,
     ServerUnavailableError,
     ValidationError,
-    TimeoutError,
+    MCPTimeoutError,
+    TimeoutError,  # deprecated alias for MCPTimeoutError
     ProtocolError,
     RoutingError,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "ServerStartupError",
     "ServerUnavailableError",
     "ValidationError",
+    "MCPTimeoutError",
     "TimeoutError",
     "ProtocolError",
     "RoutingError",
@@ -5,10 +5,11 @@ Implements TTL-based caching with LRU eviction for resource and prompt responses
 """
 
 import asyncio
+import heapq
+import itertools
 import time
-from collections import OrderedDict
-from typing import Any, Optional
-from datetime import datetime
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,26 +17,88 @@ logger = logging.getLogger(__name__)
 
 class Cache:
     """TTL-based cache with LRU eviction."""
-    
+
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
         """
         Initialize the cache.
-        
+
         Args:
             max_size: Maximum number of cache entries
             default_ttl: Default TTL in seconds (default: 5 minutes)
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: OrderedDict[str, dict] = OrderedDict()
-        self._lock = asyncio.Lock()
+        # Plain dict is insertion-ordered since 3.7; entries are
+        # (value, expires_at, ttl) tuples with the expiry precomputed at
+        # set() time so get() is a single comparison. All sync operations
+        # run on the event loop thread, so no lock is needed.
+        self._cache: dict[Hashable, Tuple[Any, float, int]] = {}
+        # Min-heap of (expires_at, seq, key) so cleanup only touches
+        # entries that are actually due. The sequence number breaks
+        # timestamp ties so heterogeneous keys are never compared.
+        # Overwritten/evicted keys leave stale heap entries behind; they
+        # are discarded lazily when popped.
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._heap_seq = itertools.count()
+        # Reverse index of server name -> keys so invalidate_server only
+        # touches that server's entries instead of scanning every key
+        self._by_server: Dict[str, Set[Hashable]] = defaultdict(set)
+        # key -> owning server for keys indexed via the set() hint, so
+        # discard can find them without re-parsing
+        self._key_server: Dict[Hashable, str] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
-    
+
+    @staticmethod
+    def _server_of(key: Hashable) -> Optional[str]:
+        """
+        Extract the owning server name from a cache key, if any.
+
+        Only string keys like "prompt:{server}.{name}:..." or
+        "resource:{server}:{path}" are parseable; tuple keys rely on the
+        server hint passed to set().
+        """
+        if not isinstance(key, str):
+            return None
+        kind, _, rest = key.partition(':')
+        if kind == 'prompt':
+            server, sep, _ = rest.partition('.')
+            return server if sep else None
+        if kind == 'resource':
+            server, sep, _ = rest.partition(':')
+            return server if sep else None
+        return None
+
+    def _index_add(self, key: Hashable, server: Optional[str] = None) -> None:
+        """
+        Add a key to the per-server reverse index.
+
+        Args:
+            key: Cache key
+            server: Owning server, if the caller already resolved it;
+                falls back to parsing the key
+        """
+        if server is None:
+            server = self._server_of(key)
+        else:
+            self._key_server[key] = server
+        if server:
+            self._by_server[server].add(key)
+
+    def _index_discard(self, key: Hashable) -> None:
+        """Remove a key from the per-server reverse index."""
+        server = self._key_server.pop(key, None) or self._server_of(key)
+        if server:
+            keys = self._by_server.get(server)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_server[server]
+
     def start_cleanup(self) -> None:
         """Start periodic cleanup of expired entries."""
         if not self._cleanup_task or self._cleanup_task.done():
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-    
+
     async def _cleanup_loop(self) -> None:
         """Periodically clean up expired entries."""
         while True:
@@ -45,131 +108,146 @@ class Cache:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in cache cleanup: {e}")
-    
+                logger.error("Error in cache cleanup: %s", e)
+
     def stop_cleanup(self) -> None:
         """Stop the cleanup task."""
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
-    
-    def get(self, key: str) -> Optional[Any]:
+
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get a value from cache.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
+        # Pop + re-insert moves the key to the end of the dict's insertion
+        # order - same LRU semantics as OrderedDict.move_to_end in one op
+        entry = self._cache.pop(key, None)
+        if entry is None:
             return None
-        
-        entry = self._cache[key]
-        
-        # Check if expired
-        age = time.time() - entry["created_at"]
-        if age > entry["ttl"]:
-            # Expired - remove it
-            del self._cache[key]
-            logger.debug(f"Cache entry expired: {key}")
+
+        # Check if expired (entry stays popped)
+        if entry[1] < time.monotonic():
+            self._index_discard(key)
+            logger.debug("Cache entry expired: %s", key)
             return None
-        
-        # Move to end (LRU)
-        self._cache.move_to_end(key)
-        
-        logger.debug(f"Cache hit: {key}")
-        return entry["value"]
-    
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+
+        self._cache[key] = entry
+
+        logger.debug("Cache hit: %s", key)
+        return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[int] = None,
+        server: Optional[str] = None
+    ) -> None:
         """
         Set a value in cache.
-        
+
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (uses default if not specified)
+            server: Owning server for targeted invalidation; callers that
+                resolved the server anyway should pass it so entries for
+                unprefixed names are indexed too
         """
         if ttl is None:
             ttl = self.default_ttl
-        
+
         # Check size limit and evict if needed
-        if len(self._cache) >= self.max_size and key not in self._cache:
+        if key not in self._cache and len(self._cache) >= self.max_size:
             # Remove oldest entry (LRU)
             oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            logger.debug(f"Cache eviction (LRU): {oldest_key}")
-        
-        # Add/update entry
-        self._cache[key] = {
-            "value": value,
-            "created_at": time.time(),
-            "ttl": ttl
-        }
-        
-        # Move to end
-        self._cache.move_to_end(key)
-        
-        logger.debug(f"Cache set: {key} (ttl={ttl}s)")
-    
-    def invalidate(self, key: str) -> None:
+            self._cache.pop(oldest_key)
+            self._index_discard(oldest_key)
+            logger.debug("Cache eviction (LRU): %s", oldest_key)
+
+        # Remove first so re-insertion lands at the end of iteration order
+        self._cache.pop(key, None)
+        expires_at = time.monotonic() + ttl
+        self._cache[key] = (value, expires_at, ttl)
+        heapq.heappush(self._expiry_heap, (expires_at, next(self._heap_seq), key))
+        self._index_add(key, server)
+
+        logger.debug("Cache set: %s (ttl=%ss)", key, ttl)
+
+    def invalidate(self, key: Hashable) -> None:
         """
         Invalidate a specific cache entry.
-        
+
         Args:
             key: Cache key to invalidate
         """
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug(f"Cache invalidated: {key}")
-    
+        # Single hash probe instead of membership check + delete
+        if self._cache.pop(key, None) is not None:
+            self._index_discard(key)
+            logger.debug("Cache invalidated: %s", key)
+
     def invalidate_server(self, server_name: str) -> None:
         """
         Invalidate all cache entries for a server.
-        
+
         Args:
             server_name: Server name
         """
-        # Find all keys for this server
-        keys_to_remove = [
-            key for key in self._cache.keys()
-            if key.startswith(f"prompt:{server_name}.") or
-               key.startswith(f"resource:{server_name}:")
-        ]
-        
+        # The reverse index holds exactly this server's keys; stale heap
+        # entries for the removed keys are discarded lazily by cleanup
+        keys_to_remove = self._by_server.pop(server_name, None)
+        if not keys_to_remove:
+            return
+
+        removed = 0
         for key in keys_to_remove:
-            del self._cache[key]
-        
-        if keys_to_remove:
-            logger.info(f"Invalidated {len(keys_to_remove)} cache entries for server '{server_name}'")
-    
+            self._key_server.pop(key, None)
+            if self._cache.pop(key, None) is not None:
+                removed += 1
+
+        if removed:
+            logger.info("Invalidated %s cache entries for server '%s'", removed, server_name)
+
     def clear(self) -> None:
         """Clear all cache entries."""
         count = len(self._cache)
         self._cache.clear()
-        logger.info(f"Cache cleared ({count} entries)")
-    
+        self._key_server.clear()
+        self._expiry_heap.clear()
+        self._by_server.clear()
+        logger.info("Cache cleared (%s entries)", count)
+
     async def cleanup_expired(self) -> None:
         """Remove expired cache entries."""
-        async with self._lock:
-            current_time = time.time()
-            expired_keys = []
-            
-            for key, entry in self._cache.items():
-                age = current_time - entry["created_at"]
-                if age > entry["ttl"]:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+
+        # Only entries at the front of the heap can be due; stop at the
+        # first expiry in the future instead of scanning the whole cache
+        while heap and heap[0][0] < now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale heap entries from keys that were overwritten,
+            # evicted, or invalidated since this push (lazy deletion)
+            if entry is not None and entry[1] == expires_at:
                 del self._cache[key]
-            
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-    
+                self._index_discard(key)
+                removed += 1
+
+        if removed:
+            logger.debug("Cleaned up %s expired cache entries", removed)
+
     def size(self) -> int:
         """Get current cache size."""
         return len(self._cache)
-    
+
     def stats(self) -> dict:
         """Get cache statistics."""
         return {
@@ -6,9 +6,58 @@ Handles loading, validating, and processing the mcp.json configuration file.
 
 import json
 import os
-from typing import Any, Dict, List, Set
+import re
+import warnings
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional
+from . import server
 from .exceptions import ConfigurationError, ValidationError
-from .types import TransportType
+
+try:
+    import fastjsonschema  # optional - compiles SCHEMA to a fast validator
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson  # optional - C JSON parser, ~3-5x faster than stdlib
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import msgspec  # optional - parse + type-check in one C pass
+    from typing import Literal, Optional as _Optional
+
+    class _ServerSpec(msgspec.Struct):
+        """Schema mirror of a single server entry."""
+        type: Literal["stdio", "sse", "websocket"]
+        command: str
+        args: List[str] = []
+        env: Dict[str, Any] = {}
+        timeout: _Optional[float] = None
+        dependencies: List[str] = []
+
+    class _ConfigSpec(msgspec.Struct):
+        """Schema mirror of mcp.json."""
+        servers: Dict[str, _ServerSpec]
+
+    _msgspec_decoder = msgspec.json.Decoder(_ConfigSpec)
+except ImportError:
+    msgspec = None
+    _msgspec_decoder = None
+
+# Fully processed configs keyed by (abspath, mtime_ns, size). Repeated
+# loads of an unchanged file skip the read/parse/validate/expand pipeline
+# entirely; any edit to the file changes the key and misses the cache.
+_LOAD_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_LOAD_CACHE_MAX = 32
+
+# ${VAR} references in config values, compiled once at import
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+_VALID_TRANSPORTS = frozenset(("stdio", "sse", "websocket"))
 
 
 class ConfigLoader:
@@ -53,11 +102,16 @@ class ConfigLoader:
         },
         "required": ["servers"]
     }
-    
+
+    # Validator compiled from SCHEMA on first use (None when
+    # fastjsonschema isn't installed; we fall back to manual checks)
+    _compiled_validator = None
+
     def __init__(self):
         """Initialize the configuration loader."""
         self._config: Dict[str, Any] = {}
         self._config_path: str = ""
+        self._startup_order: Optional[List[str]] = None
     
     def _load_env_file(self, env_path: str | None = None) -> None:
         """
@@ -75,32 +129,43 @@ class ConfigLoader:
             # .env file is optional
             return
         
+        loaded_any = False
         try:
+            environ = os.environ
             with open(env_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     line = line.strip()
-                    
+
                     # Skip empty lines and comments
                     if not line or line.startswith('#'):
                         continue
-                    
+
                     # Parse KEY=VALUE format
                     if '=' in line:
                         key, _, value = line.partition('=')
                         key = key.strip()
+
+                        # Existing environment wins; bail before doing any
+                        # quote processing on values we won't use
+                        if not key or key in environ:
+                            continue
+
                         value = value.strip()
-                        
+
                         # Remove quotes if present
-                        if value and value[0] in ('"', "'") and value[0] == value[-1]:
+                        if value.startswith(('"', "'")) and value[0] == value[-1]:
                             value = value[1:-1]
-                        
-                        # Only set if not already in environment
-                        if key and key not in os.environ:
-                            os.environ[key] = value
-        except Exception as e:
+
+                        environ[key] = value
+                        loaded_any = True
+        except (OSError, UnicodeDecodeError) as e:
             # Log warning but don't fail - .env is optional
-            import warnings
             warnings.warn(f"Failed to load .env file: {e}")
+
+        if loaded_any:
+            # Spawned servers inherit from the module-level environment
+            # snapshot, taken before these variables existed
+            server.refresh_base_env()
     
     def load(self, config_path: str) -> Dict[str, Any]:
         """
@@ -116,44 +181,72 @@ class ConfigLoader:
             ConfigurationError: If file cannot be loaded or is invalid
         """
         self._config_path = config_path
-        
+        self._startup_order = None
+
         # Check if file exists
-        if not os.path.exists(config_path):
+        try:
+            st = os.stat(config_path)
+        except OSError:
             raise ConfigurationError(
                 f"Configuration file not found: {config_path}",
                 config_path=config_path
             )
-        
+
+        # Serve an unchanged file from the processed-config cache
+        cache_key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        cached = _LOAD_CACHE.get(cache_key)
+        if cached is not None:
+            _LOAD_CACHE.move_to_end(cache_key)
+            self._config = cached
+            return cached
+
         # Load JSON
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                self._config = json.load(f)
-        except json.JSONDecodeError as e:
+                raw = f.read()
+            self._config = _loads(raw)
+        except _JSONDecodeError as e:
             raise ConfigurationError(
                 f"Invalid JSON in configuration file: {e}",
                 config_path=config_path
             )
-        except Exception as e:
+        except OSError as e:
             raise ConfigurationError(
                 f"Failed to read configuration file: {e}",
                 config_path=config_path
             )
         
-        # Validate schema
-        self.validate(self._config)
-        
-        # Check for duplicate server names (already done by dict, but explicit check)
-        self._check_duplicates()
-        
-        # Load .env file if present
+        # Validate schema. With msgspec installed the raw text is decoded
+        # straight into typed Structs - parsing and validation happen in a
+        # single C pass with no Python-level field checks. The dict kept
+        # for downstream callers still comes from _loads above so unknown
+        # keys survive; the Struct decode is validation only.
+        if _msgspec_decoder is not None:
+            try:
+                _msgspec_decoder.decode(raw)
+            except msgspec.ValidationError as e:
+                raise ValidationError(str(e), validation_type="schema")
+        else:
+            self.validate(self._config)
+
+        # Load .env file if present. This happens regardless of ${VAR}
+        # references: servers may consume its variables through plain
+        # environment inheritance
         self._load_env_file()
-        
-        # Expand environment variables
-        self._config = self.expand_env_vars(self._config)
-        
-        # Validate dependencies
-        self._validate_dependencies()
-        
+
+        # Only walk the tree when the raw text actually contains a ${VAR}
+        # reference - the common case has none, saving the expansion pass
+        if '${' in raw:
+            self._config = self.expand_env_vars(self._config)
+
+        # Duplicate names, dependency references, cycles and startup order
+        # are all handled in one pass over the server graph
+        self._startup_order = self._topo_sort(self._config.get("servers", {}))
+
+        _LOAD_CACHE[cache_key] = self._config
+        if len(_LOAD_CACHE) > _LOAD_CACHE_MAX:
+            _LOAD_CACHE.popitem(last=False)
+
         return self._config
     
     def validate(self, config: Dict[str, Any]) -> bool:
@@ -169,7 +262,25 @@ class ConfigLoader:
         Raises:
             ValidationError: If configuration is invalid
         """
-        # Basic schema validation (would use jsonschema in production)
+        # Prefer the compiled validator: fastjsonschema turns SCHEMA into
+        # generated Python once, so each validate() is a single call with
+        # no per-field isinstance chains or error-kwargs dicts built on
+        # the happy path
+        if fastjsonschema is not None:
+            cls = ConfigLoader
+            if cls._compiled_validator is None:
+                cls._compiled_validator = fastjsonschema.compile(cls.SCHEMA)
+            try:
+                cls._compiled_validator(config)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValidationError(
+                    str(e),
+                    validation_type="schema",
+                    details={"path": list(getattr(e, "path", []))}
+                )
+            return True
+
+        # Fallback: hand-rolled schema checks (stdlib-only installs)
         if not isinstance(config, dict):
             raise ValidationError("Configuration must be a dictionary")
         
@@ -212,7 +323,7 @@ class ConfigLoader:
         
         # Validate transport type
         transport_type = config["type"]
-        if transport_type not in ["stdio", "sse", "websocket"]:
+        if transport_type not in _VALID_TRANSPORTS:
             raise ValidationError(
                 f"Server '{name}' has invalid transport type '{transport_type}'",
                 validation_type="invalid_value",
@@ -264,132 +375,172 @@ class ConfigLoader:
         Returns:
             Configuration with expanded variables
         """
-        import copy
-        import re
-        
-        config = copy.deepcopy(config)
-        env_var_pattern = re.compile(r'\$\{([^}]+)\}')
-        
-        def expand_value(value: Any) -> Any:
-            """Recursively expand environment variables in values."""
+        # Fast exit: a flat scan that allocates nothing per node. Configs
+        # without a single ${VAR} reference (the typical case) return
+        # unchanged without ever building path tuples below.
+        scan: List[Any] = [config]
+        found = False
+        while scan:
+            value = scan.pop()
             if isinstance(value, str):
-                # Find all ${VAR} patterns
-                matches = env_var_pattern.findall(value)
-                for var_name in matches:
-                    env_value = os.environ.get(var_name, '')
-                    if not env_value:
-                        # Variable not set - could warn or error
-                        pass
-                    value = value.replace(f'${{{var_name}}}', env_value)
-                return value
+                if '${' in value:
+                    found = True
+                    break
             elif isinstance(value, dict):
-                return {k: expand_value(v) for k, v in value.items()}
+                scan.extend(value.values())
             elif isinstance(value, list):
-                return [expand_value(item) for item in value]
-            else:
-                return value
-        
-        return expand_value(config)
+                scan.extend(value)
+        if not found:
+            return config
+
+        # Closure-local binding: the sub callback resolves env_get via
+        # LOAD_FAST instead of the os.environ.get attribute chain
+        env_get = os.environ.get
+
+        # Pass 1: walk the tree with an explicit stack (no Python frames,
+        # no RecursionError on deep configs) and collect substitutions.
+        # Most strings have no reference; the substring test skips the
+        # regex machinery for them.
+        replacements: List[tuple] = []
+        stack: List[tuple] = [((), config)]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, str):
+                if '${' in value:
+                    expanded = _ENV_VAR_RE.sub(
+                        lambda m: env_get(m.group(1), ''), value
+                    )
+                    if expanded != value:
+                        replacements.append((path, expanded))
+            elif isinstance(value, dict):
+                for k, v in value.items():
+                    stack.append((path + (k,), v))
+            elif isinstance(value, list):
+                for i, v in enumerate(value):
+                    stack.append((path + (i,), v))
+
+        if not replacements:
+            return config
+
+        # Pass 2: copy-on-write rebuild - only containers on a changed
+        # path are cloned, unchanged subtrees stay shared with the input
+        clones: Dict[tuple, Any] = {
+            (): config.copy() if isinstance(config, dict) else list(config)
+        }
+        for path, expanded in replacements:
+            node = clones[()]
+            prefix = ()
+            for key in path[:-1]:
+                prefix = prefix + (key,)
+                child = clones.get(prefix)
+                if child is None:
+                    original = node[key]
+                    child = (original.copy() if isinstance(original, dict)
+                             else list(original))
+                    node[key] = child
+                    clones[prefix] = child
+                node = child
+            node[path[-1]] = expanded
+
+        return clones[()]
     
-    def _check_duplicates(self) -> None:
-        """Check for duplicate server names."""
-        servers = self._config.get("servers", {})
-        server_names = list(servers.keys())
-        
-        # Dict keys are already unique, but check for case-insensitive duplicates
-        seen: Set[str] = set()
-        for name in server_names:
+    def _topo_sort(self, servers: Dict[str, Any]) -> List[str]:
+        """
+        Validate the server graph and sort it by dependency.
+
+        A single pass over the servers catches case-insensitive duplicate
+        names and references to unknown servers while building the
+        dependency graph; an iterative Kahn's sort then detects cycles and
+        produces the startup order without Python recursion frames.
+        """
+        in_degree = {name: 0 for name in servers}
+        dependents: Dict[str, List[str]] = {name: [] for name in servers}
+        lowered: Dict[str, str] = {}
+
+        for name, server_config in servers.items():
             name_lower = name.lower()
-            if name_lower in seen:
+            if name_lower in lowered:
                 raise ConfigurationError(
                     f"Duplicate server name '{name}' (case-insensitive)",
                     config_path=self._config_path,
                     field=f"servers.{name}"
                 )
-            seen.add(name_lower)
-    
-    def _validate_dependencies(self) -> None:
-        """
-        Validate server dependencies.
-        
-        Checks that:
-        1. All dependency references exist
-        2. No circular dependencies
-        """
-        servers = self._config.get("servers", {})
-        
-        # Build dependency graph
-        for server_name, server_config in servers.items():
-            dependencies = server_config.get("dependencies", [])
-            
-            for dep in dependencies:
-                # Check dependency exists
+            lowered[name_lower] = name
+
+            for dep in server_config.get("dependencies", []):
                 if dep not in servers:
                     raise ConfigurationError(
-                        f"Server '{server_name}' depends on non-existent server '{dep}'",
+                        f"Server '{name}' depends on non-existent server '{dep}'",
                         config_path=self._config_path,
-                        field=f"servers.{server_name}.dependencies"
-                    )
-        
-        # Check for circular dependencies
-        self._check_circular_dependencies(servers)
-    
-    def _check_circular_dependencies(self, servers: Dict[str, Any]) -> None:
-        """Check for circular dependencies using DFS."""
-        visited: Set[str] = set()
-        recursion_stack: Set[str] = set()
-        
-        def dfs(server_name: str) -> bool:
-            """DFS to detect cycles."""
-            visited.add(server_name)
-            recursion_stack.add(server_name)
-            
-            dependencies = servers[server_name].get("dependencies", [])
-            for dep in dependencies:
-                if dep not in visited:
-                    if dfs(dep):
-                        return True
-                elif dep in recursion_stack:
-                    raise ConfigurationError(
-                        f"Circular dependency detected: {server_name} -> {dep}",
-                        config_path=self._config_path
+                        field=f"servers.{name}.dependencies"
                     )
-            
-            recursion_stack.remove(server_name)
-            return False
-        
-        for server_name in servers:
-            if server_name not in visited:
-                dfs(server_name)
-    
+                in_degree[name] += 1
+                dependents[dep].append(name)
+
+        queue = deque(name for name, degree in in_degree.items() if degree == 0)
+        order: List[str] = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(order) != len(servers):
+            # Everything left with unmet in-degree sits on a cycle
+            remaining = [name for name in servers if in_degree[name] > 0]
+            raise ConfigurationError(
+                f"Circular dependency detected involving: {', '.join(remaining)}",
+                config_path=self._config_path
+            )
+
+        return order
+
     def get_startup_order(self) -> List[str]:
         """
         Get servers in dependency order (topological sort).
-        
+
         Returns:
             List of server names in order to start them
         """
+        if self._startup_order is None:
+            self._startup_order = self._topo_sort(self._config.get("servers", {}))
+        return self._startup_order
+
+    def get_startup_levels(self) -> List[List[str]]:
+        """
+        Get servers grouped into dependency levels.
+
+        Servers within a level have no dependencies on each other and can
+        be started concurrently; each level only depends on servers in
+        earlier levels.
+
+        Returns:
+            List of levels, each a list of server names
+        """
         servers = self._config.get("servers", {})
-        visited: Set[str] = set()
-        order: List[str] = []
-        
-        def dfs(server_name: str) -> None:
-            """DFS for topological sort."""
-            if server_name in visited:
-                return
-            
-            visited.add(server_name)
-            
-            dependencies = servers[server_name].get("dependencies", [])
-            for dep in dependencies:
-                dfs(dep)
-            
-            order.append(server_name)
-        
-        for server_name in servers:
-            dfs(server_name)
-        
-        return order
+        in_degree = {name: 0 for name in servers}
+        dependents: Dict[str, List[str]] = {name: [] for name in servers}
+
+        for name, server_config in servers.items():
+            for dep in server_config.get("dependencies", []):
+                in_degree[name] += 1
+                dependents[dep].append(name)
+
+        levels: List[List[str]] = []
+        current = [name for name, degree in in_degree.items() if degree == 0]
+        while current:
+            levels.append(current)
+            next_level: List[str] = []
+            for name in current:
+                for dependent in dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_level.append(dependent)
+            current = next_level
+
+        return levels
     
     @staticmethod
     def get_json_schema() -> Dict[str, Any]:
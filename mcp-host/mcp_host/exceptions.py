@@ -10,11 +10,14 @@ from typing import Any, Dict, Optional
 
 class MCPHostError(Exception):
     """Base exception for all MCP Host errors."""
-    pass
+
+    __slots__ = ()
 
 
 class ConfigurationError(MCPHostError):
     """Raised when there is an error in the configuration file."""
+
+    __slots__ = ("config_path", "field")
     
     def __init__(self, message: str, config_path: Optional[str] = None, field: Optional[str] = None):
         self.config_path = config_path
@@ -24,6 +27,8 @@ class ConfigurationError(MCPHostError):
 
 class ServerStartupError(MCPHostError):
     """Raised when a server fails to start or initialize."""
+
+    __slots__ = ("server_name",)
     
     def __init__(self, message: str, server_name: Optional[str] = None):
         self.server_name = server_name
@@ -32,6 +37,8 @@ class ServerStartupError(MCPHostError):
 
 class ServerUnavailableError(MCPHostError):
     """Raised when attempting to use an unavailable server."""
+
+    __slots__ = ("server_name",)
     
     def __init__(self, message: str, server_name: Optional[str] = None):
         self.server_name = server_name
@@ -40,6 +47,8 @@ class ServerUnavailableError(MCPHostError):
 
 class ValidationError(MCPHostError):
     """Raised when validation fails (config, parameters, messages)."""
+
+    __slots__ = ("validation_type", "details")
     
     def __init__(self, message: str, validation_type: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         self.validation_type = validation_type
@@ -47,17 +56,26 @@ class ValidationError(MCPHostError):
         super().__init__(message)
 
 
-class TimeoutError(MCPHostError):
+class MCPTimeoutError(MCPHostError):
     """Raised when an operation times out."""
-    
+
+    __slots__ = ("operation", "timeout_seconds")
+
     def __init__(self, message: str, operation: Optional[str] = None, timeout_seconds: Optional[float] = None):
         self.operation = operation
         self.timeout_seconds = timeout_seconds
         super().__init__(message)
 
 
+# Deprecated alias: this class used to shadow the builtin TimeoutError,
+# which made `except TimeoutError` ambiguous with asyncio/socket timeouts
+TimeoutError = MCPTimeoutError
+
+
 class ProtocolError(MCPHostError):
     """Raised when there is a protocol-level error."""
+
+    __slots__ = ("protocol_version", "details")
     
     def __init__(self, message: str, protocol_version: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         self.protocol_version = protocol_version
@@ -67,6 +85,8 @@ class ProtocolError(MCPHostError):
 
 class RoutingError(MCPHostError):
     """Raised when a request cannot be routed to a server."""
+
+    __slots__ = ("target", "reason")
     
     def __init__(self, message: str, target: Optional[str] = None, reason: Optional[str] = None):
         self.target = target
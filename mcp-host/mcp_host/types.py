@@ -5,28 +5,46 @@ This module contains all the type definitions used throughout the MCP Host,
 including protocol messages, server state, and capability definitions.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 from datetime import datetime
 
 
-class ServerState(Enum):
-    """State of an MCP server process."""
+# JSON schema type name -> Python type(s), shared by every validation
+# call instead of being rebuilt per check
+_TYPE_MAP = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+    "null": type(None),
+}
+
+
+class ServerState(str, Enum):
+    """State of an MCP server process.
+
+    The str mixin lets members serialize and compare as plain strings
+    (status payloads, log formatting) without .value indirection.
+    """
     STARTING = "starting"
     READY = "ready"
     UNAVAILABLE = "unavailable"
     SHUTDOWN = "shutdown"
 
 
-class TransportType(Enum):
+class TransportType(str, Enum):
     """Transport type for MCP server communication."""
     STDIO = "stdio"
     SSE = "sse"
     WEBSOCKET = "websocket"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """Represents an MCP tool capability."""
     name: str
@@ -35,21 +53,36 @@ class Tool:
     title: Optional[str] = None
     annotations: Optional[Dict[str, Any]] = None
     outputSchema: Optional[Dict[str, Any]] = None
-    
+    # Compiled schema validator, attached by the registry at
+    # registration time when fastjsonschema is available
+    _validator: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    # Memoized required-key set for the fallback validator
+    _required: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """Validate parameters against the input schema."""
-        # Basic validation - can be extended with jsonschema
         if not self.inputSchema:
             return True
-        
-        required = self.inputSchema.get("required", [])
+
+        # Schema was compiled once at registration; one call instead of
+        # walking the schema dict per validation
+        if self._validator is not None:
+            try:
+                self._validator(params)
+                return True
+            except ValueError:
+                return False
+
+        # Basic validation - can be extended with jsonschema
+
+        if self._required is None:
+            self._required = frozenset(self.inputSchema.get("required", []))
         properties = self.inputSchema.get("properties", {})
-        
+
         # Check required parameters
-        for req in required:
-            if req not in params:
-                return False
-        
+        if not self._required <= params.keys():
+            return False
+
         # Check parameter types (basic check)
         for key, value in params.items():
             if key in properties:
@@ -61,22 +94,13 @@ class Tool:
     
     def _check_type(self, value: Any, expected_type: str) -> bool:
         """Check if value matches expected JSON schema type."""
-        type_map = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "object": dict,
-            "array": list,
-            "null": type(None),
-        }
-        expected_python_type = type_map.get(expected_type)
+        expected_python_type = _TYPE_MAP.get(expected_type)
         if expected_python_type:
             return isinstance(value, expected_python_type)
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class Prompt:
     """Represents an MCP prompt capability."""
     name: str
@@ -84,7 +108,7 @@ class Prompt:
     arguments: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """Represents an MCP resource capability."""
     uri: str
@@ -93,36 +117,53 @@ class Resource:
     mime_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerCapabilities:
     """Capabilities provided by an MCP server."""
     tools: List[Tool] = field(default_factory=list)
     prompts: List[Prompt] = field(default_factory=list)
     resources: List[Resource] = field(default_factory=list)
-    
+    # Lazy name indices, built on first lookup; setdefault keeps the
+    # first-match semantics of the original linear scans
+    _tool_map: Optional[Dict[str, Tool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _prompt_map: Optional[Dict[str, Prompt]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _resource_map: Optional[Dict[str, Resource]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
-        for tool in self.tools:
-            if tool.name == name:
-                return tool
-        return None
-    
+        if self._tool_map is None:
+            index: Dict[str, Tool] = {}
+            for tool in self.tools:
+                index.setdefault(tool.name, tool)
+            self._tool_map = index
+        return self._tool_map.get(name)
+
     def get_prompt(self, name: str) -> Optional[Prompt]:
         """Get a prompt by name."""
-        for prompt in self.prompts:
-            if prompt.name == name:
-                return prompt
-        return None
-    
+        if self._prompt_map is None:
+            index: Dict[str, Prompt] = {}
+            for prompt in self.prompts:
+                index.setdefault(prompt.name, prompt)
+            self._prompt_map = index
+        return self._prompt_map.get(name)
+
     def get_resource(self, uri: str) -> Optional[Resource]:
         """Get a resource by URI."""
-        for resource in self.resources:
-            if resource.uri == uri:
-                return resource
-        return None
+        if self._resource_map is None:
+            index: Dict[str, Resource] = {}
+            for resource in self.resources:
+                index.setdefault(resource.uri, resource)
+            self._resource_map = index
+        return self._resource_map.get(uri)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerInfo:
     """Information about a running MCP server."""
     name: str
@@ -136,7 +177,7 @@ class ServerInfo:
     started_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Entry in the response cache."""
     key: str
@@ -150,7 +191,7 @@ class CacheEntry:
         return age > self.ttl
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsData:
     """Metrics for a server or operation."""
     request_count: int = 0
@@ -159,7 +200,12 @@ class MetricsData:
     total_latency: float = 0.0
     min_latency: float = float('inf')
     max_latency: float = 0.0
-    latencies: List[float] = field(default_factory=list)
+    # Ring buffer of the most recent samples: maxlen makes the window
+    # bound O(1) instead of re-slicing the list on every record
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+    # p95 memo, recomputed only when request_count has advanced
+    _p95_cache: float = field(default=0.0, init=False, repr=False)
+    _p95_cache_count: int = field(default=-1, init=False, repr=False)
     
     @property
     def avg_latency(self) -> float:
@@ -186,12 +232,19 @@ class MetricsData:
         """Calculate 95th percentile latency."""
         if not self.latencies:
             return 0.0
-        sorted_latencies = sorted(self.latencies)
-        idx = int(len(sorted_latencies) * 0.95)
-        return sorted_latencies[idx] if idx < len(sorted_latencies) else sorted_latencies[-1]
+        # Only pay the O(N log N) sort when new samples have arrived
+        if self._p95_cache_count != self.request_count:
+            sorted_latencies = sorted(self.latencies)
+            idx = int(len(sorted_latencies) * 0.95)
+            self._p95_cache = (
+                sorted_latencies[idx] if idx < len(sorted_latencies)
+                else sorted_latencies[-1]
+            )
+            self._p95_cache_count = self.request_count
+        return self._p95_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCRequest:
     """JSON-RPC 2.0 request message."""
     jsonrpc: str = "2.0"
@@ -212,7 +265,7 @@ class JSONRPCRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCResponse:
     """JSON-RPC 2.0 response message."""
     jsonrpc: str = "2.0"
@@ -238,7 +291,7 @@ class JSONRPCResponse:
         return self.error is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCNotification:
     """JSON-RPC 2.0 notification message (no response expected)."""
     jsonrpc: str = "2.0"
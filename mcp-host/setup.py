@@ -26,12 +26,19 @@ setup(
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
     ],
     python_requires=">=3.10",
     install_requires=[
         # No external dependencies - uses only Python stdlib
     ],
     extras_require={
+        "fast": [
+            "uvloop>=0.19; sys_platform != 'win32'",
+            "orjson>=3.9",
+            "fastjsonschema>=2.19",
+            "msgspec>=0.18",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.21",
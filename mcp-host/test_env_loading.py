@@ -4,13 +4,9 @@ Test script to verify .env file loading in mcp-host.
 """
 
 import os
-import sys
 import tempfile
 from pathlib import Path
 
-# Add mcp-host to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "mcp-host"))
-
 from mcp_host.config import ConfigLoader
 
 